@@ -1,41 +1,25 @@
 import sys
-import asyncio
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget, QTextEdit, QFileDialog
+    QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, QWidget, QTextEdit, QFileDialog,
+    QListWidget, QListWidgetItem
 )
-from PyQt5.QtCore import QThread, pyqtSignal
-from extractor import extract_pdf_content
-from text_processing import clean_text, analyze_key_sections
-from summarizer import generate_summary
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from job_manager import JobManager, QUEUED, RUNNING, SUMMARIZING, DONE, FAILED, CANCELLED
 
-class PDFProcessorThread(QThread):
-    finished = pyqtSignal(str, str)
-    error = pyqtSignal(str)
+# 작업 상태 표시 문자열
+STATUS_LABELS = {
+    QUEUED: "대기",
+    RUNNING: "추출 중",
+    SUMMARIZING: "요약 중",
+    DONE: "완료",
+    FAILED: "오류",
+    CANCELLED: "취소됨",
+}
 
-    def __init__(self, pdf_path, emphasis=None, exclude=None):
-        super().__init__()
-        self.pdf_path = pdf_path
-        self.emphasis = emphasis
-        self.exclude = exclude
-
-    def run(self):
-        try:
-            # PDF 데이터 추출
-            text, title, ocr_text = extract_pdf_content(self.pdf_path)
-
-            # 텍스트 처리 및 키워드 분석
-            cleaned_text = clean_text(text + " " + ocr_text)
-            keywords = analyze_key_sections(cleaned_text)
 
-            # 요약 생성
-            summary = asyncio.run(generate_summary(
-                cleaned_text, title, ocr_text, keywords,
-                emphasis=self.emphasis, exclude=self.exclude
-            ))
-
-            self.finished.emit(title, summary)
-        except Exception as e:
-            self.error.emit(str(e))
+class JobSignals(QObject):
+    """워커 스레드의 작업 상태 변경을 메인(UI) 스레드로 전달"""
+    updated = pyqtSignal(object)
 
 
 # class PDFProcessorThread(QThread):
@@ -71,19 +55,36 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("PDF Processor and Summary Viewer")
         self.setGeometry(200, 200, 900, 700)
 
+        # 작업 관리자 (워커 풀 + 공유 이벤트 루프)
+        self.signals = JobSignals()
+        self.signals.updated.connect(self.update_job)
+        self.job_manager = JobManager(max_workers=2, on_update=self.signals.updated.emit)
+        self.job_items = {}
+
         # Layout 설정
         layout = QVBoxLayout()
 
+        # 작업 목록 (작업별 진행 상황)
+        self.job_list = QListWidget()
+        self.job_list.currentItemChanged.connect(self.show_selected_job)
+        layout.addWidget(self.job_list, 1)
+
         # 텍스트 요약 표시 영역
         self.summary_text = QTextEdit()
         self.summary_text.setReadOnly(True)
         self.summary_text.setPlaceholderText("PDF 요약 결과가 여기에 표시됩니다.")
-        layout.addWidget(self.summary_text)
+        layout.addWidget(self.summary_text, 3)
 
-        # 버튼: PDF 파일 로드
+        # 버튼: PDF 파일 로드 / 선택 작업 취소
+        button_layout = QHBoxLayout()
         self.load_button = QPushButton("Load PDF")
         self.load_button.clicked.connect(self.load_pdf)
-        layout.addWidget(self.load_button)
+        button_layout.addWidget(self.load_button)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_selected_job)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
 
         # Main Layout 설정
         container = QWidget()
@@ -91,27 +92,64 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
     def load_pdf(self):
-        """PDF 파일을 선택하고 처리"""
+        """PDF 파일(여러 개 선택 가능)을 선택하고 작업 큐에 추가"""
         options = QFileDialog.Options()
-        pdf_path, _ = QFileDialog.getOpenFileName(self, "Select PDF File", "", "PDF Files (*.pdf);;All Files (*)",
-                                                  options=options)
+        pdf_paths, _ = QFileDialog.getOpenFileNames(self, "Select PDF Files", "", "PDF Files (*.pdf);;All Files (*)",
+                                                    options=options)
 
-        if pdf_path:
+        for pdf_path in pdf_paths:
             self.process_pdf(pdf_path)
 
     def process_pdf(self, pdf_path):
-        """PDF를 처리하고 요약 결과를 UI에 표시"""
-        self.summary_text.clear()
-
+        """PDF 처리 작업을 큐에 추가"""
         # 사용자 입력을 통해 강조/제외 주제를 설정
         emphasis = ["도핑 농도"]
         exclude = ["실험 방법"]
 
-        # 스레드 생성 및 연결
-        self.thread = PDFProcessorThread(pdf_path, emphasis=emphasis, exclude=exclude)
-        self.thread.finished.connect(self.display_summary)
-        self.thread.error.connect(self.display_error)
-        self.thread.start()
+        job = self.job_manager.submit(pdf_path, emphasis=emphasis, exclude=exclude)
+        if self.job_list.currentItem() is None:
+            self.job_list.setCurrentItem(self.job_items[job.job_id])
+
+    def cancel_selected_job(self):
+        """선택된 작업 취소"""
+        item = self.job_list.currentItem()
+        if item is not None:
+            self.job_manager.cancel(item.data(Qt.UserRole))
+
+    def update_job(self, job):
+        """작업 목록의 진행 상황 갱신"""
+        item = self.job_items.get(job.job_id)
+        if item is None:
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, job.job_id)
+            self.job_items[job.job_id] = item
+            self.job_list.addItem(item)
+
+        label = f"[{STATUS_LABELS[job.status]}] {job.name} - 페이지 {job.pages_done}/{job.pages_total}, " \
+                f"OCR 이미지 {job.images_done}/{job.images_total}"
+        item.setText(label)
+
+        if self.job_list.currentItem() is item:
+            self.display_job(job)
+
+    def show_selected_job(self, current, _previous):
+        """선택된 작업의 요약(또는 진행 중인 요약) 표시"""
+        if current is None:
+            self.summary_text.clear()
+            return
+        job = self.job_manager.get(current.data(Qt.UserRole))
+        if job is not None:
+            self.display_job(job)
+
+    def display_job(self, job):
+        if job.status == FAILED:
+            self.display_error(job.error)
+        elif job.status == CANCELLED:
+            self.summary_text.setPlainText("작업이 취소되었습니다.")
+        elif job.summary:
+            self.display_summary(job.title, job.summary)
+        else:
+            self.summary_text.clear()
 
     # def process_pdf(self, pdf_path):
     #     """PDF를 처리하고 요약 결과를 UI에 표시"""
@@ -131,6 +169,11 @@ class MainWindow(QMainWindow):
         """오류 메시지를 UI에 표시"""
         self.summary_text.setPlainText(f"Error processing PDF: {error_message}")
 
+    def closeEvent(self, event):
+        """창을 닫을 때 진행 중인 작업 취소"""
+        self.job_manager.shutdown(wait=False)
+        super().closeEvent(event)
+
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -0,0 +1,95 @@
+"""
+파일 이름: benchmark_text_normalizer.py
+설명: 이 파일은 기존 다중 패스 정규식 클렌징과 text_normalizer 엔진의 처리 시간을
+수 MB 크기의 합성 텍스트로 비교합니다.
+
+실행 예:
+    python benchmark_text_normalizer.py --size-mb 8 --repeat 3
+"""
+
+import argparse
+import random
+import re
+import time
+
+from text_normalizer import clean_document_text, normalize_ocr_text, clean_chunks
+
+# 일반 단어 위주에 페이지 번호, 수식, OCR 오류 토큰이 드물게 섞인 텍스트
+WORD_TOKENS = [
+    "the", "quick", "brown", "fox", "sample", "layer", "Figure", "Table", "result", "value",
+    "결과", "분석", "데이터", "반도체", "도핑", "농도", "실험", "측정", "10%", "2024", "3.14",
+    "\n", "\n\n", "\t", "  ",
+]
+NOISE_TOKENS = ["Page 12", "$x^2 + y$", "2OO4", "3.l4", "I", "Oliver", "ㄱㅏ"]
+NOISE_RATIO = 0.03
+
+
+def legacy_advanced_clean_text(text):
+    """기존 text_processing.advanced_clean_text (비교용)"""
+    text = re.sub(r'\bPage\s?\d+\b', '', text)
+    text = re.sub(r'\$.*?\$', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_post_process_text(text):
+    """기존 ocr_processor.post_process_text (비교용)"""
+    text = re.sub(r'\s+', ' ', text).strip()
+    text = re.sub(r'([ㄱ-ㅎ])([ㅏ-ㅣ])', lambda m: chr(
+        ord('가') + ((ord(m.group(1)) - ord('ㄱ')) * 28 * 21) + ((ord(m.group(2)) - ord('ㅏ')) * 28)), text)
+    text = re.sub(r'[oO]', '0', text)
+    text = re.sub(r'[lI]', '1', text)
+    text = re.sub(r'\n+', ' ', text)
+    return text.strip()
+
+
+def make_pages(size_mb, page_chars=4000, seed=0):
+    """합성 페이지 텍스트 리스트 생성"""
+    rng = random.Random(seed)
+    pages = []
+    total = 0
+    while total < size_mb * 1024 * 1024:
+        words = []
+        length = 0
+        while length < page_chars:
+            token = rng.choice(NOISE_TOKENS if rng.random() < NOISE_RATIO else WORD_TOKENS)
+            words.append(token)
+            length += len(token) + 1
+        page = " ".join(words)
+        pages.append(page)
+        total += len(page)
+    return pages
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 정규화 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=8, help="합성 텍스트 크기 (MB, 문자 수 기준)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = make_pages(args.size_mb)
+    text = "\n\n".join(pages)
+    print(f"입력: {len(text) / 1e6:.1f}M 문자, {len(pages)} 페이지")
+
+    cases = [
+        ("문서 클렌징", lambda: legacy_advanced_clean_text(text), lambda: clean_document_text(text)),
+        ("문서 클렌징 (페이지 청크)", lambda: legacy_advanced_clean_text(text), lambda: clean_chunks(pages)),
+        ("OCR 후처리", lambda: legacy_post_process_text(text), lambda: normalize_ocr_text(text)),
+    ]
+    for name, legacy, engine in cases:
+        legacy_time = best_time(legacy, args.repeat)
+        engine_time = best_time(engine, args.repeat)
+        print(f"{name}: 기존 {legacy_time:.3f}s, 엔진 {engine_time:.3f}s ({legacy_time / engine_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
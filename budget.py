@@ -0,0 +1,241 @@
+"""
+파일 이름: budget.py
+설명: 이 파일은 대용량 PDF를 제한된 작업량으로 처리하기 위한 예산(페이지 범위, 최대 페이지/이미지 수,
+실행 시간/CPU 시간 제한)과 페이지 샘플링, 처리 범위(coverage) 보고서를 제공합니다.
+"""
+
+import os
+import time
+from collections import deque
+
+import fitz
+
+# 앞부분(표지, 초록, 목차 등)으로 항상 먼저 처리할 페이지 수
+FRONT_MATTER_PAGES = 3
+
+# 처리 중단 사유
+STOP_DEADLINE = "deadline"
+STOP_CPU_TIME = "cpu_time"
+STOP_MAX_PAGES = "max_pages"
+STOP_MAX_IMAGES = "max_images"
+
+
+def _cpu_time():
+    """현재 프로세스와 종료된 하위 프로세스(Tesseract 등)의 CPU 시간 합계 (Windows에서는 하위 프로세스 시간이 0)"""
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+class ProcessingBudget:
+    """
+    문서 하나를 처리할 때의 작업량 제한.
+
+    Args:
+        page_range (tuple, optional): 처리할 페이지 범위 (시작, 끝), 1부터 시작하며 끝 포함
+        max_pages (int, optional): 텍스트를 추출할 최대 페이지 수. 초과 시 페이지를 샘플링
+        max_images (int, optional): OCR할 최대 이미지 수
+        deadline_seconds (float, optional): 실행 시간(wall-clock) 제한 (초)
+        cpu_seconds (float, optional): CPU 시간 제한 (초). POSIX에서는 종료된 Tesseract 하위 프로세스의 시간도 포함
+
+    Attributes:
+        coverage (CoverageReport): 이 예산으로 마지막에 처리한 문서의 처리 범위 보고서 (처리 전에는 None)
+    """
+
+    def __init__(self, page_range=None, max_pages=None, max_images=None, deadline_seconds=None, cpu_seconds=None):
+        self.page_range = page_range
+        self.max_pages = max_pages
+        self.max_images = max_images
+        self.deadline_seconds = deadline_seconds
+        self.cpu_seconds = cpu_seconds
+        self.coverage = None
+        self._wall_start = None
+        self._cpu_start = None
+
+    def start(self):
+        """시간 측정 시작"""
+        self._wall_start = time.monotonic()
+        self._cpu_start = _cpu_time()
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self._wall_start if self._wall_start is not None else 0.0
+
+    @property
+    def cpu_elapsed(self):
+        return _cpu_time() - self._cpu_start if self._cpu_start is not None else 0.0
+
+    def exhausted(self):
+        """
+        시간 제한 초과 여부를 확인합니다.
+
+        Returns:
+            str: 초과한 제한의 사유 (STOP_DEADLINE, STOP_CPU_TIME). 남아 있으면 None.
+        """
+        if self.deadline_seconds is not None and self.elapsed >= self.deadline_seconds:
+            return STOP_DEADLINE
+        if self.cpu_seconds is not None and self.cpu_elapsed >= self.cpu_seconds:
+            return STOP_CPU_TIME
+        return None
+
+
+class BudgetCancelEvent:
+    """
+    취소 이벤트 대용 객체. 사용자 취소 이벤트가 설정되었거나 예산의 시간 제한을 넘으면 설정된 것으로 봅니다.
+    cancel_event.is_set()을 주기적으로 확인하는 run_tesseract_cancellable에 넘기면
+    실행 중인 OCR도 제한 시간에 중단됩니다.
+
+    Args:
+        budget (ProcessingBudget): 시작된 예산
+        cancel_event (threading.Event, optional): 사용자 취소 이벤트
+    """
+
+    def __init__(self, budget, cancel_event=None):
+        self.budget = budget
+        self.cancel_event = cancel_event
+
+    def is_set(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return True
+        return self.budget.exhausted() is not None
+
+
+class CoverageReport:
+    """예산 모드로 처리한 결과의 처리 범위 보고서 (무엇을 처리하고 무엇을 건너뛰었는지)"""
+
+    def __init__(self, total_pages, page_range, planned_pages):
+        self.total_pages = total_pages
+        self.page_range = page_range  # 실제 적용된 (시작, 끝), 1부터 시작
+        self.planned_pages = planned_pages  # 우선순위 순서의 0부터 시작하는 페이지 번호
+        self.processed_pages = []
+        self.images_found = 0
+        self.images_processed = 0
+        self.images_dropped = 0  # 중복이거나 디코딩할 수 없어 처리 대상에서 빠진 이미지
+        self.stop_reason = None
+        self.elapsed_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    @property
+    def skipped_pages(self):
+        """처리하지 않은 페이지 (0부터 시작, 오름차순)"""
+        processed = set(self.processed_pages)
+        return [page for page in range(self.total_pages) if page not in processed]
+
+    @property
+    def images_skipped(self):
+        """예산 때문에 OCR하지 못한 이미지 수"""
+        return self.images_found - self.images_processed - self.images_dropped
+
+    @property
+    def complete(self):
+        return not self.skipped_pages and self.images_skipped == 0
+
+    def skipped_page_ranges(self):
+        """건너뛴 페이지를 1부터 시작하는 (시작, 끝) 구간 리스트로 반환"""
+        ranges = []
+        for page in self.skipped_pages:
+            number = page + 1
+            if ranges and ranges[-1][1] == number - 1:
+                ranges[-1][1] = number
+            else:
+                ranges.append([number, number])
+        return [tuple(r) for r in ranges]
+
+    def to_dict(self):
+        """상태 조회/직렬화용 딕셔너리"""
+        return {
+            "total_pages": self.total_pages,
+            "page_range": list(self.page_range),
+            "processed_pages": [page + 1 for page in sorted(self.processed_pages)],
+            "skipped_page_ranges": [list(r) for r in self.skipped_page_ranges()],
+            "images_found": self.images_found,
+            "images_processed": self.images_processed,
+            "images_dropped": self.images_dropped,
+            "images_skipped": self.images_skipped,
+            "stop_reason": self.stop_reason,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "complete": self.complete,
+        }
+
+    def __str__(self):
+        skipped = ", ".join(f"{a}-{b}" if a != b else str(a) for a, b in self.skipped_page_ranges()) or "없음"
+        return (f"페이지 {len(self.processed_pages)}/{self.total_pages} 처리 (건너뜀: {skipped}), "
+                f"이미지 OCR {self.images_processed}/{self.images_found - self.images_dropped}, "
+                f"중단 사유: {self.stop_reason or '없음'}, {self.elapsed_seconds:.1f}초")
+
+
+def _spread_order(pages):
+    """어느 앞부분을 잘라도 문서 전체에 고르게 퍼지도록 페이지 순서를 정합니다 (구간 이분 BFS)."""
+    if not pages:
+        return []
+    order = [pages[0], pages[-1]] if len(pages) > 1 else [pages[0]]
+    intervals = deque([(1, len(pages) - 2)])
+    while intervals:
+        lo, hi = intervals.popleft()
+        if lo > hi:
+            continue
+        mid = (lo + hi) // 2
+        order.append(pages[mid])
+        intervals.append((lo, mid - 1))
+        intervals.append((mid + 1, hi))
+    return order
+
+
+def plan_pages(page_count, toc, budget):
+    """
+    처리할 페이지를 우선순위 순서로 정합니다.
+    앞부분(FRONT_MATTER_PAGES) → 목차의 각 절 시작 페이지(상위 수준 먼저) → 나머지를 고르게 분산한 순서.
+
+    Args:
+        page_count (int): 문서의 전체 페이지 수
+        toc (list): doc.get_toc() 결과 ([수준, 제목, 페이지(1부터)] 리스트)
+        budget (ProcessingBudget): 예산
+
+    Returns:
+        tuple: (적용된 페이지 범위 (시작, 끝), 우선순위 순서의 0부터 시작하는 페이지 번호 리스트)
+
+    Raises:
+        ValueError: page_range의 시작이 끝보다 크거나, 시작 페이지가 문서의 페이지 수를 넘는 경우
+    """
+    if budget.page_range is not None:
+        first, last = budget.page_range
+        if first > last:
+            raise ValueError(f"잘못된 페이지 범위입니다: {first}-{last}")
+        if first > page_count:
+            raise ValueError(f"시작 페이지({first})가 문서의 페이지 수({page_count})를 넘습니다.")
+    first, last = budget.page_range or (1, page_count)
+    first = max(1, first)
+    last = min(page_count, last)
+    if first > last:
+        return (first, last), []
+
+    candidates = list(range(first - 1, last))
+    in_range = set(candidates)
+
+    ordered = candidates[:FRONT_MATTER_PAGES]
+    section_starts = sorted((level, page - 1) for level, _title, page, *_ in toc)
+    ordered += [page for _level, page in section_starts if page in in_range]
+    ordered += _spread_order(candidates)
+
+    seen = set()
+    plan = []
+    for page in ordered:
+        if page not in seen:
+            seen.add(page)
+            plan.append(page)
+
+    if budget.max_pages is not None:
+        plan = plan[:budget.max_pages]
+    return (first, last), plan
+
+
+def plan_pages_for_pdf(pdf_path, budget):
+    """
+    PDF의 페이지 수와 목차(outline)로 처리 계획을 세우고 보고서를 만듭니다.
+
+    Returns:
+        CoverageReport: planned_pages가 채워진 보고서
+    """
+    doc = fitz.open(pdf_path)
+    page_range, plan = plan_pages(len(doc), doc.get_toc(), budget)
+    return CoverageReport(len(doc), page_range, plan)
@@ -0,0 +1,20 @@
+"""
+파일 이름: cancellation.py
+설명: 이 파일은 작업 취소를 위한 공용 예외와 확인 함수를 제공합니다.
+추출/OCR/요약 단계는 threading.Event를 받아 주기적으로 취소 여부를 확인합니다.
+"""
+
+
+class JobCancelled(Exception):
+    """사용자 요청으로 작업이 취소되었을 때 발생하는 예외"""
+
+
+def raise_if_cancelled(cancel_event):
+    """
+    취소 이벤트가 설정되어 있으면 JobCancelled 예외를 발생시킵니다.
+
+    Args:
+        cancel_event (threading.Event, optional): 취소 이벤트. None이면 아무것도 하지 않음.
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        raise JobCancelled("작업이 취소되었습니다.")
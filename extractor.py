@@ -6,28 +6,113 @@
 
 from pdf_text_extractor import extract_text_from_pdf
 from pdf_title_extractor import extract_title_from_pdf
-from pdf_image_extractor import extract_and_save_images
+from pdf_image_extractor import extract_and_save_images, count_candidate_images
 from ocr_processor import extract_text_from_image
+from cancellation import JobCancelled, raise_if_cancelled
+from budget import plan_pages_for_pdf, BudgetCancelEvent, STOP_MAX_PAGES, STOP_MAX_IMAGES
 
-def extract_pdf_content(pdf_path, save_dir=None):
+
+def _budget_exhausted(budget, coverage):
+    """예산의 시간 제한을 확인하고, 처음 초과한 사유를 보고서에 기록"""
+    reason = budget.exhausted()
+    if reason and coverage.stop_reason is None:
+        coverage.stop_reason = reason
+    return reason is not None
+
+
+def extract_pdf_content(pdf_path, save_dir=None, progress=None, cancel_event=None, budget=None):
     """
     PDF에서 텍스트, 제목, 이미지, 그리고 OCR 데이터를 추출합니다.
 
     Args:
         pdf_path (str): PDF 파일 경로
         save_dir (str, optional): 추출한 이미지를 저장할 디렉토리
+        progress (callable, optional): (단계, 완료 수, 전체 수)로 호출되는 진행 콜백.
+            단계는 "pages"(텍스트 추출 페이지) 또는 "images"(OCR 완료 이미지)
+        cancel_event (threading.Event, optional): 설정되면 JobCancelled 예외로 중단
+        budget (budget.ProcessingBudget, optional): 작업량 제한. 주어지면 앞부분, 목차의 절 시작 페이지,
+            고르게 분산된 페이지 순으로 샘플링하고, 시간 제한에 도달하면 실행 중인 OCR을 중단하고
+            남은 페이지/이미지를 건너뜁니다. 처리 범위 보고서(budget.CoverageReport)는 budget.coverage에 기록됩니다.
 
     Returns:
         tuple: PDF 텍스트, 제목, OCR 텍스트 (이미지에서 추출)
     """
+    coverage = None
+    pages = None
+    should_stop = None
+    ocr_cancel_event = cancel_event
+    if budget is not None:
+        budget.start()
+        coverage = budget.coverage = plan_pages_for_pdf(pdf_path, budget)
+        pages = coverage.planned_pages
+        should_stop = lambda: _budget_exhausted(budget, coverage)
+        ocr_cancel_event = BudgetCancelEvent(budget, cancel_event)
+
+    pages_done = 0
+
+    def on_page(done, total):
+        nonlocal pages_done
+        pages_done = done
+        if progress:
+            progress("pages", done, total)
+
     # 텍스트 추출
-    text = extract_text_from_pdf(pdf_path)
+    text = extract_text_from_pdf(pdf_path, progress=on_page, cancel_event=cancel_event,
+                                 pages=pages, should_stop=should_stop)
 
     # 제목 추출
     title = extract_title_from_pdf(pdf_path)
 
     # 이미지 추출 및 OCR 수행
-    images_with_metadata = extract_and_save_images(pdf_path, save_dir=save_dir)
-    ocr_texts = [extract_text_from_image(image) for image, _ in images_with_metadata]
+    raise_if_cancelled(cancel_event)
+    if budget is None:
+        images_with_metadata = extract_and_save_images(pdf_path, save_dir=save_dir)
+    else:
+        # 텍스트를 처리한 페이지의 이미지만 대상으로 함
+        coverage.processed_pages = pages[:pages_done]
+        coverage.images_found = count_candidate_images(pdf_path, coverage.processed_pages)
+        if _budget_exhausted(budget, coverage):
+            images_with_metadata = []
+        else:
+            images_with_metadata = extract_and_save_images(pdf_path, save_dir=save_dir,
+                                                           pages=coverage.processed_pages,
+                                                           max_images=budget.max_images)
+            # 요청한 수보다 적게 나온 만큼은 중복/식별 불가로 빠진 이미지
+            requested = coverage.images_found
+            if budget.max_images is not None:
+                requested = min(requested, budget.max_images)
+            coverage.images_dropped = requested - len(images_with_metadata)
+
+    ocr_texts = []
+    total_images = len(images_with_metadata)
+    if progress:
+        progress("images", 0, total_images)
+    for index, (image, _) in enumerate(images_with_metadata, start=1):
+        if budget is not None and _budget_exhausted(budget, coverage):
+            break
+        try:
+            ocr_text = extract_text_from_image(image, cancel_event=ocr_cancel_event)
+        except JobCancelled:
+            # 사용자 취소는 그대로 전달하고, 시간 제한으로 중단된 경우에는 남은 이미지를 건너뜀
+            raise_if_cancelled(cancel_event)
+            _budget_exhausted(budget, coverage)
+            break
+        if ocr_text:
+            ocr_texts.append(ocr_text)
+        if coverage is not None:
+            coverage.images_processed = index
+        if progress:
+            progress("images", index, total_images)
+
+    if budget is None:
+        return text, title, " ".join(ocr_texts)
 
+    first, last = coverage.page_range
+    if coverage.stop_reason is None and len(coverage.planned_pages) < last - first + 1:
+        coverage.stop_reason = STOP_MAX_PAGES
+    if coverage.stop_reason is None and budget.max_images is not None \
+            and coverage.images_found > budget.max_images:
+        coverage.stop_reason = STOP_MAX_IMAGES
+    coverage.elapsed_seconds = budget.elapsed
+    coverage.cpu_seconds = budget.cpu_elapsed
     return text, title, " ".join(ocr_texts)
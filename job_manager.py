@@ -0,0 +1,269 @@
+"""
+파일 이름: job_manager.py
+설명: 이 파일은 여러 PDF 요약 작업을 큐에 넣고 병렬로 처리하는 작업 관리자를 제공합니다.
+추출/OCR은 크기가 제한된 워커 풀에서, 요약(OpenAI 호출)은 하나의 장기 실행 asyncio 루프 스레드에서 수행하며,
+각 작업은 협조적으로 취소할 수 있습니다.
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cancellation import JobCancelled, raise_if_cancelled
+from extractor import extract_pdf_content
+from text_processing import clean_text_chunks, analyze_key_sections
+from summarizer import generate_summary
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUMMARIZING = "summarizing"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class QueueFull(Exception):
+    """대기 중인 작업 수가 최대 큐 깊이에 도달해 새 작업을 받을 수 없을 때 발생하는 예외"""
+
+
+class Job:
+    """단일 PDF 요약 작업의 상태와 진행 정보"""
+
+    def __init__(self, job_id, pdf_path, emphasis=None, exclude=None):
+        self.job_id = job_id
+        self.pdf_path = pdf_path
+        self.emphasis = emphasis
+        self.exclude = exclude
+        self.status = QUEUED
+        self.pages_done = 0
+        self.pages_total = 0
+        self.images_done = 0
+        self.images_total = 0
+        self.title = ""
+        self.summary = ""  # 스트리밍 중에는 지금까지 생성된 부분 요약
+        self.error = None
+        self.cancel_event = threading.Event()
+        self._future = None
+        self._summary_future = None
+
+    @property
+    def name(self):
+        return os.path.basename(self.pdf_path)
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def to_dict(self):
+        """상태 조회/직렬화용 딕셔너리"""
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "status": self.status,
+            "pages": {"done": self.pages_done, "total": self.pages_total},
+            "images": {"done": self.images_done, "total": self.images_total},
+            "title": self.title,
+            "summary": self.summary,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    PDF 요약 작업 관리자.
+
+    Args:
+        max_workers (int): 동시에 추출/OCR을 수행할 최대 작업 수
+        on_update (callable, optional): 작업 상태가 바뀔 때마다 Job을 인자로 호출되는 콜백.
+            워커 스레드에서 호출되므로 UI에서는 시그널 등으로 메인 스레드에 전달해야 합니다.
+        max_queue_depth (int, optional): 실행 중인 작업 외에 대기할 수 있는 최대 작업 수.
+            None이면 제한 없음. 초과하면 submit이 QueueFull을 발생시킵니다.
+        summarize_fn (coroutine function, optional): 요약 생성 함수. 기본값은 generate_summary이며,
+            테스트나 오프라인 실행 시 같은 시그니처의 가짜 백엔드로 교체할 수 있습니다.
+        max_finished_jobs (int, optional): 보관할 종료된 작업의 최대 수. 초과하면 오래된 것부터 삭제.
+            None이면 제한 없음 (UI처럼 사용자가 직접 목록을 관리하는 경우).
+    """
+
+    def __init__(self, max_workers=2, on_update=None, max_queue_depth=None, summarize_fn=generate_summary,
+                 max_finished_jobs=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf-job")
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, name="pdf-job-loop", daemon=True)
+        self._loop_thread.start()
+        self._on_update = on_update
+        self._max_workers = max_workers
+        self._max_queue_depth = max_queue_depth
+        self._summarize_fn = summarize_fn
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # asyncio.run()처럼 남은 작업을 취소하고 루프를 닫음
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    @property
+    def loop(self):
+        """요약 호출이 실행되는 공유 asyncio 루프"""
+        return self._loop
+
+    def submit(self, pdf_path, emphasis=None, exclude=None):
+        """
+        작업을 큐에 추가하고 Job 객체를 반환합니다.
+
+        Raises:
+            QueueFull: 대기 중인 작업 수가 max_queue_depth에 도달한 경우
+        """
+        with self._lock:
+            if self._max_queue_depth is not None:
+                active = sum(1 for job in self._jobs.values() if not job.finished)
+                if active >= self._max_workers + self._max_queue_depth:
+                    raise QueueFull(f"작업 큐가 가득 찼습니다 (최대 대기 {self._max_queue_depth}개).")
+            job = Job(next(self._ids), pdf_path, emphasis=emphasis, exclude=exclude)
+            self._jobs[job.job_id] = job
+        job._future = self._executor.submit(self._run_job, job)
+        self._notify(job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """제출 순서대로 모든 작업을 반환합니다."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id):
+        """
+        작업을 취소합니다. 대기 중이면 즉시 취소하고, 실행 중이면 Tesseract 프로세스와
+        진행 중인 API 호출을 중단시킵니다.
+
+        Returns:
+            bool: 취소 요청이 받아들여졌는지 여부
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+
+        job.cancel_event.set()
+        if job._future is not None and job._future.cancel():
+            # 아직 시작되지 않은 작업
+            job.status = CANCELLED
+            self._notify(job)
+            self._prune_finished()
+        else:
+            # 작업 스레드가 finally에서 None으로 되돌릴 수 있으므로 한 번만 읽음
+            summary_future = job._summary_future
+            if summary_future is not None:
+                summary_future.cancel()
+        return True
+
+    def remove(self, job_id):
+        """완료된 작업을 목록에서 제거합니다. 실행 중인 작업은 제거하지 않습니다."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return False
+            del self._jobs[job_id]
+            return True
+
+    def _prune_finished(self):
+        """max_finished_jobs를 넘는 오래된 종료 작업을 삭제"""
+        if self._max_finished_jobs is None:
+            return
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:max(0, len(finished) - self._max_finished_jobs)]:
+                del self._jobs[job_id]
+
+    def shutdown(self, wait=True):
+        """모든 작업을 취소하고 워커 풀과 이벤트 루프를 종료합니다 (루프는 루프 스레드가 끝날 때 닫힘)."""
+        for job in self.jobs():
+            self.cancel(job.job_id)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._loop_thread.join()
+
+    def _notify(self, job):
+        if self._on_update:
+            try:
+                self._on_update(job)
+            except Exception:
+                logger.exception("작업 상태 콜백 실패")
+
+    def _on_progress(self, job, stage, done, total):
+        if stage == "pages":
+            job.pages_done, job.pages_total = done, total
+        elif stage == "images":
+            job.images_done, job.images_total = done, total
+        self._notify(job)
+
+    def _on_delta(self, job, delta):
+        if delta is None:
+            # 스트리밍 중 재시도: 실패한 시도의 부분 요약을 버림
+            job.summary = ""
+        else:
+            job.summary += delta
+        self._notify(job)
+
+    def _run_job(self, job):
+        job.status = RUNNING
+        self._notify(job)
+        try:
+            # PDF 데이터 추출
+            text, title, ocr_text = extract_pdf_content(
+                job.pdf_path,
+                progress=lambda stage, done, total: self._on_progress(job, stage, done, total),
+                cancel_event=job.cancel_event,
+            )
+            job.title = title
+
+            # 텍스트 처리 및 키워드 분석
+            cleaned_text = clean_text_chunks([text, ocr_text])
+            keywords = analyze_key_sections(cleaned_text)
+            raise_if_cancelled(job.cancel_event)
+
+            # 요약 생성 (공유 이벤트 루프에서 실행)
+            job.status = SUMMARIZING
+            self._notify(job)
+            job._summary_future = asyncio.run_coroutine_threadsafe(self._summarize_fn(
+                cleaned_text, title, ocr_text, keywords,
+                emphasis=job.emphasis, exclude=job.exclude,
+                on_delta=lambda delta: self._on_delta(job, delta),
+            ), self._loop)
+            if job.cancel_event.is_set():
+                job._summary_future.cancel()
+
+            job.summary = job._summary_future.result()
+            job.status = DONE
+        except (JobCancelled, concurrent.futures.CancelledError):
+            job.status = CANCELLED
+        except Exception as e:
+            logger.exception("작업 %s 처리 실패", job.job_id)
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job._summary_future = None
+        self._notify(job)
+        self._prune_finished()
@@ -7,14 +7,14 @@
 import asyncio
 from PyQt5.QtWidgets import QApplication, QFileDialog
 from extractor import extract_pdf_content
-from text_processing import clean_text, analyze_key_sections
+from text_processing import clean_text_chunks, analyze_key_sections
 from summarizer import generate_summary
 import sys
 
 if sys.platform.startswith('win'):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-async def summarize_pdf(pdf_path, save_dir=None, keywords=None):
+async def summarize_pdf(pdf_path, save_dir=None, keywords=None, budget=None):
     """
     PDF 파일을 요약합니다. 비동기 방식으로 실행합니다.
 
@@ -22,15 +22,17 @@ async def summarize_pdf(pdf_path, save_dir=None, keywords=None):
         pdf_path (str): PDF 파일 경로
         save_dir (str, optional): 추출된 이미지를 저장할 디렉토리
         keywords (list, optional): 키워드 리스트
+        budget (budget.ProcessingBudget, optional): 페이지 범위, 최대 페이지/이미지 수, 시간 제한.
+            처리 범위 보고서는 budget.coverage에 기록됩니다.
 
     Returns:
         str: 생성된 요약 텍스트
     """
     # PDF 데이터 추출
-    text, title, ocr_text = extract_pdf_content(pdf_path)
+    text, title, ocr_text = extract_pdf_content(pdf_path, save_dir=save_dir, budget=budget)
 
     # 텍스트 클렌징
-    cleaned_text = clean_text(text + " " + ocr_text)
+    cleaned_text = clean_text_chunks([text, ocr_text])
 
     # 키워드 분석
     extracted_keywords = analyze_key_sections(cleaned_text)
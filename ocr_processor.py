@@ -3,13 +3,28 @@ from PIL import Image, ImageOps, ImageFilter
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import re
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from cancellation import JobCancelled, raise_if_cancelled
+from text_region_detector import detect_text_regions, crop_text_regions, union_area
+from text_normalizer import normalize_ocr_text
 
 # Tesseract 경로 설정
 pytesseract.pytesseract.tesseract_cmd = r"C:/Program Files/Tesseract-OCR/tesseract.exe"
 
+# 전체 이미지 OCR 시 시도할 PSM 모드
+FULL_IMAGE_PSM_MODES = [6, 3, 4, 11]
+# 텍스트 영역 크롭은 이미 텍스트 블록이므로 적은 모드로 충분
+REGION_PSM_MODES = [6, 4]
+# 텍스트 영역이 이미지 면적의 이 비율 이상이면 크롭하지 않고 전체 이미지를 OCR
+FULL_IMAGE_COVERAGE = 0.6
 
-def preprocess_image(image):
-    """이미지 전처리 개선"""
+
+def preprocess_image(image, cancel_event=None):
+    """이미지 전처리 개선 (기울기 감지용 OSD 실행도 cancel_event로 중단 가능)"""
     # 이미지 크기 정규화 (300 DPI 기준)
     desired_dpi = 300
     current_dpi = image.info.get('dpi', (72, 72))[0]
@@ -37,72 +52,149 @@ def preprocess_image(image):
 
     # 기울기 보정
     try:
-        osd = pytesseract.image_to_osd(binary)
+        osd = image_to_osd(binary, cancel_event)
         angle = float(re.search(r'Rotate: (\d+)', osd).group(1))
         if angle > 0:
             binary = binary.rotate(angle, expand=True, fillcolor=255)
-    except:
+    except JobCancelled:
+        raise
+    except Exception:
         pass
 
     return binary
 
 
-def extract_text_from_image(image, lang='kor+eng'):
-    """개선된 OCR 텍스트 추출"""
+def prepare_tesseract_input(image):
+    """
+    Tesseract 입력용 PNG로 저장할 수 있게 이미지를 정리합니다.
+    pytesseract의 prepare()처럼 투명 배경은 흰색으로 채우고, PNG로 저장할 수 없는 모드(CMYK 등)는 RGB로 변환합니다.
+    """
+    if "A" in image.getbands():
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, (0, 0), image.getchannel("A"))
+        return background
+    if image.mode not in ("1", "L", "RGB", "P"):
+        return image.convert("RGB")
+    return image
+
+
+def run_tesseract_cancellable(image, lang, config, cancel_event, poll_interval=0.1):
+    """
+    취소 가능한 Tesseract 실행.
+    pytesseract는 실행 중인 프로세스를 외부에서 중단할 수 없으므로 직접 서브프로세스를 띄우고,
+    취소 이벤트가 설정되면 프로세스를 종료(kill)합니다.
+
+    Raises:
+        JobCancelled: 취소 이벤트가 설정된 경우
+        pytesseract.TesseractError: Tesseract가 0이 아닌 코드로 종료된 경우 (stderr 내용 포함)
+    """
+    raise_if_cancelled(cancel_event)
+
+    fd, input_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
     try:
-        processed_image = preprocess_image(image)
-
-        # 다양한 PSM 모드 시도
-        psm_modes = [6, 3, 4, 11]
-        results = []
-
-        for psm in psm_modes:
-            config = f'--oem 3 --psm {psm} -c preserve_interword_spaces=1 -c tessedit_char_blacklist=|~_^°'
-
-            # 원본 이미지로 시도
-            results.append(pytesseract.image_to_string(image, lang=lang, config=config))
-            # 전처리된 이미지로 시도
-            results.append(pytesseract.image_to_string(processed_image, lang=lang, config=config))
-
-        # 결과 중 가장 좋은 것 선택 (특수문자 비율이 적고 길이가 긴 것)
-        filtered_results = [r for r in results if len(r.strip()) > 0]
-        if not filtered_results:
+        prepare_tesseract_input(image).save(input_path, format="PNG")
+        cmd = [pytesseract.pytesseract.tesseract_cmd, input_path, "stdout", "-l", lang]
+        cmd += shlex.split(config, posix=not sys.platform.startswith('win'))
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        while True:
+            try:
+                output, errors = proc.communicate(timeout=poll_interval)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    raise JobCancelled("작업이 취소되었습니다.")
+        if proc.returncode != 0:
+            message = " ".join(errors.decode("utf-8", errors="ignore").splitlines()).strip()
+            raise pytesseract.TesseractError(proc.returncode, message)
+        return output.decode("utf-8", errors="ignore")
+    finally:
+        os.remove(input_path)
+
+
+def image_to_string(image, lang, config, cancel_event=None):
+    """취소 이벤트 유무에 따라 pytesseract 또는 취소 가능한 실행기를 사용"""
+    if cancel_event is None:
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+    return run_tesseract_cancellable(image, lang, config, cancel_event)
+
+
+def image_to_osd(image, cancel_event=None):
+    """방향/문자 감지(OSD). image_to_string과 같은 방식으로 실행기를 선택"""
+    if cancel_event is None:
+        return pytesseract.image_to_osd(image)
+    return run_tesseract_cancellable(image, "osd", "--psm 0", cancel_event)
+
+
+def ocr_best_text(image, lang, psm_modes, cancel_event=None):
+    """
+    여러 PSM 모드로 원본/전처리 이미지를 OCR하여 가장 좋은 결과를 반환합니다.
+
+    Returns:
+        str: 가장 좋은 OCR 결과 (후처리 전). 결과가 없으면 None.
+    """
+    processed_image = preprocess_image(image, cancel_event)
+    results = []
+
+    for psm in psm_modes:
+        config = f'--oem 3 --psm {psm} -c preserve_interword_spaces=1 -c tessedit_char_blacklist=|~_^°'
+
+        # 원본 이미지로 시도
+        results.append(image_to_string(image, lang, config, cancel_event))
+        # 전처리된 이미지로 시도
+        results.append(image_to_string(processed_image, lang, config, cancel_event))
+
+    # 결과 중 가장 좋은 것 선택 (특수문자 비율이 적고 길이가 긴 것)
+    filtered_results = [r for r in results if len(r.strip()) > 0]
+    if not filtered_results:
+        return None
+
+    return max(filtered_results,
+               key=lambda x: (len(x.strip()),
+                              -len(re.findall(r'[^a-zA-Z0-9가-힣\s]', x))))
+
+
+def extract_text_from_image(image, lang='kor+eng', cancel_event=None, detect_regions=True):
+    """
+    개선된 OCR 텍스트 추출.
+    detect_regions가 True이면 텍스트 영역을 먼저 찾아 해당 영역만 OCR하고,
+    텍스트 줄이 없는 이미지(빈 이미지, 사진, 그래프 등)는 OCR 없이 빈 문자열을 반환합니다.
+    """
+    try:
+        raise_if_cancelled(cancel_event)
+
+        if detect_regions:
+            boxes = detect_text_regions(image)
+            if not boxes:
+                return ""
+
+            image_area = image.width * image.height
+            if union_area(boxes) < image_area * FULL_IMAGE_COVERAGE:
+                region_texts = []
+                for crop in crop_text_regions(image, boxes):
+                    region_text = ocr_best_text(crop, lang, REGION_PSM_MODES, cancel_event)
+                    if region_text:
+                        region_texts.append(region_text)
+                if not region_texts:
+                    return "텍스트를 추출할 수 없습니다."
+                return post_process_text("\n".join(region_texts))
+
+        text = ocr_best_text(image, lang, FULL_IMAGE_PSM_MODES, cancel_event)
+        if text is None:
             return "텍스트를 추출할 수 없습니다."
 
-        text = max(filtered_results,
-                   key=lambda x: (len(x.strip()),
-                                  -len(re.findall(r'[^a-zA-Z0-9가-힣\s]', x))))
-
         return post_process_text(text)
+    except JobCancelled:
+        raise
     except Exception as e:
         return f"OCR 오류 발생: {str(e)}"
 
 
 def post_process_text(text):
-    """텍스트 후처리 개선"""
-    # 기본 정규화
-    text = normalize_text(text)
-
-    # 한글 자모음 결합 오류 수정
-    text = re.sub(r'([ㄱ-ㅎ])([ㅏ-ㅣ])', lambda m: chr(
-        ord('가') + ((ord(m.group(1)) - ord('ㄱ')) * 28 * 21) + ((ord(m.group(2)) - ord('ㅏ')) * 28)), text)
-
-    # 숫자 형식 통일
-    text = re.sub(r'[oO]', '0', text)  # O를 0으로
-    text = re.sub(r'[lI]', '1', text)  # l이나 I를 1로
-
-    # 불필요한 줄바꿈 제거
-    text = re.sub(r'\n+', ' ', text)
-
-    return text.strip()
-
-def normalize_text(text):
-    """텍스트 정규화"""
-    # 여러 공백을 하나로 통일
-    text = re.sub(r'\s+', ' ', text)
-    # 앞뒤 공백 제거
-    return text.strip()
-
+    """텍스트 후처리 개선 (공백 정리, 자모 결합, 숫자 토큰 교정을 한 번에 처리)"""
+    return normalize_ocr_text(text)
 
 def calculate_text_similarity(text1, text2):
     """TF-IDF 기반 텍스트 유사도 계산"""
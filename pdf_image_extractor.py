@@ -4,6 +4,28 @@ from PIL import Image, UnidentifiedImageError
 import hashlib
 from multiprocessing import Pool
 
+# 이 크기보다 작은 이미지(아이콘, 글머리 기호 등)는 OCR 대상에서 제외
+MIN_IMAGE_SIDE = 32
+MIN_IMAGE_AREA = 64 * 64
+# 가로세로 비율이 이보다 큰 이미지(구분선, 테두리 등)는 장식용으로 간주
+MAX_IMAGE_ASPECT = 20
+
+
+def is_decorative_image(width, height):
+    """
+    크기 메타데이터만으로 작거나 장식용인 이미지를 판별 (디코딩 전에 사용)
+
+    Args:
+        width (int): 이미지 너비
+        height (int): 이미지 높이
+
+    Returns:
+        bool: 제외해야 할 이미지이면 True
+    """
+    if min(width, height) < MIN_IMAGE_SIDE or width * height < MIN_IMAGE_AREA:
+        return True
+    return max(width, height) / min(width, height) > MAX_IMAGE_ASPECT
+
 
 def process_page_images(args):
     """
@@ -21,6 +43,11 @@ def process_page_images(args):
     for img in images_info:
         xref = img['xref']
         base_image = img['base_image']
+
+        # 작거나 장식용 이미지는 디코딩하지 않고 생략
+        if is_decorative_image(base_image["width"], base_image["height"]):
+            continue
+
         image_bytes = base_image["image"]
         img_hash = hashlib.md5(image_bytes).hexdigest()  # 이미지의 MD5 해시 계산
 
@@ -50,11 +77,13 @@ def process_page_images(args):
     return page_num, images
 
 
-def extract_images_parallel(pdf_path):
+def extract_images_parallel(pdf_path, pages=None, max_images=None):
     """
     PDF의 모든 페이지를 병렬로 처리하여 이미지를 추출.
     Args:
         pdf_path (str): PDF 파일 경로.
+        pages (list, optional): 처리할 페이지 번호(0부터) 리스트. None이면 모든 페이지.
+        max_images (int, optional): 추출할 최대 이미지 수. pages 순서대로 채우며 초과분은 디코딩하지 않음.
 
     Returns:
         list: [(이미지 객체, 메타데이터)의 리스트].
@@ -62,10 +91,22 @@ def extract_images_parallel(pdf_path):
     doc = fitz.open(pdf_path)
     pages_data = []
 
-    for page_num, page in enumerate(doc):
+    page_numbers = range(len(doc)) if pages is None else pages
+    remaining = max_images
+
+    for page_num in page_numbers:
+        if remaining is not None and remaining <= 0:
+            break
         images_info = []
-        for img in page.get_images(full=True):
-            xref = img[0]
+        for img in doc[page_num].get_images(full=True):
+            xref, width, height = img[0], img[2], img[3]
+            # 이미지 데이터를 꺼내기 전에 크기로 먼저 거르기
+            if is_decorative_image(width, height):
+                continue
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                remaining -= 1
             base_image = doc.extract_image(xref)
             images_info.append({
                 "xref": xref,
@@ -82,6 +123,26 @@ def extract_images_parallel(pdf_path):
     return images_with_metadata
 
 
+def count_candidate_images(pdf_path, pages=None):
+    """
+    이미지를 디코딩하지 않고 OCR 대상이 될 이미지(장식용 제외) 수를 셉니다.
+    Args:
+        pdf_path (str): PDF 파일 경로.
+        pages (list, optional): 셀 페이지 번호(0부터) 리스트. None이면 모든 페이지.
+
+    Returns:
+        int: 이미지 수.
+    """
+    doc = fitz.open(pdf_path)
+    page_numbers = range(len(doc)) if pages is None else pages
+    return sum(
+        1
+        for page_num in page_numbers
+        for img in doc[page_num].get_images(full=True)
+        if not is_decorative_image(img[2], img[3])
+    )
+
+
 def save_images(images_with_metadata, save_dir):
     """
     추출된 이미지를 저장
@@ -98,17 +159,19 @@ def save_images(images_with_metadata, save_dir):
         print(f"저장됨: {save_path}")
 
 
-def extract_and_save_images(pdf_path, save_dir=None):
+def extract_and_save_images(pdf_path, save_dir=None, pages=None, max_images=None):
     """
     PDF에서 병렬로 이미지를 추출하고 저장.
     Args:
         pdf_path (str): PDF 파일 경로.
         save_dir (str, optional): 이미지를 저장할 디렉토리. None이면 저장하지 않음.
+        pages (list, optional): 처리할 페이지 번호(0부터) 리스트. None이면 모든 페이지.
+        max_images (int, optional): 추출할 최대 이미지 수.
 
     Returns:
         list: (이미지 객체, 메타데이터)의 리스트.
     """
-    images_with_metadata = extract_images_parallel(pdf_path)
+    images_with_metadata = extract_images_parallel(pdf_path, pages=pages, max_images=max_images)
 
     # 저장 디렉토리가 제공되면 저장
     if save_dir:
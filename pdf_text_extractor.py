@@ -1,13 +1,19 @@
 import fitz
+from cancellation import raise_if_cancelled
 
 
-def extract_text_from_pdf(pdf_path, keywords=None):
+def extract_text_from_pdf(pdf_path, keywords=None, progress=None, cancel_event=None, pages=None, should_stop=None):
     """
     PDF 파일에서 텍스트를 추출 (키워드 필터링 기능 추가)
 
     Args:
         pdf_path (str): PDF 파일 경로.
         keywords (list, optional): 검색할 키워드 리스트. None이면 전체 텍스트 반환.
+        progress (callable, optional): 페이지마다 (처리한 페이지 수, 전체 페이지 수)로 호출되는 콜백.
+        cancel_event (threading.Event, optional): 설정되면 다음 페이지 처리 전에 JobCancelled 발생.
+        pages (list, optional): 처리할 페이지 번호(0부터) 리스트. 주어진 순서대로 처리하며 결과는 페이지 순으로 정렬.
+            None이면 모든 페이지.
+        should_stop (callable, optional): 페이지마다 호출되어 True를 반환하면 남은 페이지를 처리하지 않고 중단.
 
     Returns:
         str: 추출된 텍스트 (키워드가 포함된 텍스트만 반환).
@@ -15,9 +21,18 @@ def extract_text_from_pdf(pdf_path, keywords=None):
     doc = fitz.open(pdf_path)
     full_text = []
 
-    for page_num, page in enumerate(doc):
+    page_numbers = range(len(doc)) if pages is None else pages
+    page_count = len(page_numbers)
+
+    for index, page_num in enumerate(page_numbers):
+        raise_if_cancelled(cancel_event)
+        if should_stop and should_stop():
+            break
+
         # 블록 단위로 텍스트 추출
-        blocks = page.get_text("blocks")
+        blocks = doc[page_num].get_text("blocks")
+        if progress:
+            progress(index + 1, page_count)
         if not blocks:
             continue
 
@@ -41,9 +56,10 @@ def extract_text_from_pdf(pdf_path, keywords=None):
 
         # 페이지에 키워드와 관련된 텍스트가 있으면 추가
         if page_text:
-            full_text.append(f"==== Page {page_num + 1} ====\n" + " ".join(page_text))
+            full_text.append((page_num, f"==== Page {page_num + 1} ====\n" + " ".join(page_text)))
 
-    return "\n\n".join(full_text) if full_text else "키워드와 일치하는 텍스트가 없습니다."
+    full_text.sort(key=lambda item: item[0])
+    return "\n\n".join(text for _, text in full_text) if full_text else "키워드와 일치하는 텍스트가 없습니다."
 
 
 
@@ -0,0 +1,335 @@
+"""
+파일 이름: service.py
+설명: 이 파일은 PDF 요약 파이프라인을 로컬 HTTP 서비스로 제공합니다.
+작업은 JobManager의 워커 풀에서 처리되며, 큐가 가득 차면 429로 응답합니다.
+
+엔드포인트:
+    POST   /jobs               PDF 업로드(Content-Type: application/pdf) 또는
+                               JSON {"path": ..., "emphasis": [...], "exclude": [...]}
+    GET    /jobs               모든 작업 상태
+    GET    /jobs/<id>          작업 상태 조회
+    GET    /jobs/<id>/events   상태 변경 스트리밍 (NDJSON, 작업 종료 시 끝남)
+    GET    /jobs/<id>/result   요약 결과 (완료 전에는 409)
+    DELETE /jobs/<id>          실행 중이면 취소, 종료된 작업이면 삭제
+
+실행 예:
+    python service.py --port 8080 --workers 2 --max-queue 8
+    python service.py --fake-llm   # OpenAI 호출 없이 오프라인으로 실행
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from job_manager import JobManager, QueueFull, DONE, FAILED, CANCELLED
+from summarizer import generate_summary
+
+if sys.platform.startswith('win'):
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+logger = logging.getLogger(__name__)
+
+# 업로드 가능한 최대 PDF 크기 (바이트)
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+# 대기열 포화 시 클라이언트에 권장하는 재시도 간격 (초)
+RETRY_AFTER_SECONDS = 5
+# 이벤트 스트림의 상태 확인 간격 (초)
+EVENT_POLL_INTERVAL = 0.5
+# 결과 조회를 위해 보관할 종료된 작업 수 (초과 시 오래된 것부터 삭제)
+MAX_FINISHED_JOBS = 100
+
+
+async def fake_generate_summary(text, title, ocr_text, keywords, emphasis=None, exclude=None,
+                                max_tokens=500, temperature=0.7, on_delta=None):
+    """
+    오프라인 테스트용 가짜 요약 백엔드. generate_summary와 같은 시그니처를 가지며,
+    본문 앞부분을 단어 단위로 스트리밍하여 요약처럼 반환합니다.
+    """
+    words = f"{title} {text}".split()[:50]
+    parts = []
+    for word in words:
+        await asyncio.sleep(0)
+        delta = word + " "
+        parts.append(delta)
+        if on_delta:
+            on_delta(delta)
+    return "".join(parts).strip()
+
+
+def _is_string_list(value):
+    """None이거나 문자열만 담은 리스트인지 확인"""
+    return value is None or (isinstance(value, list) and all(isinstance(item, str) for item in value))
+
+
+class SummaryRequestHandler(BaseHTTPRequestHandler):
+    """요약 작업 HTTP 요청 처리기. self.server에 manager와 upload_dir이 설정되어 있어야 합니다."""
+
+    server_version = "PDFSummaryService/1.0"
+
+    def log_message(self, format, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
+
+    # ---- 응답 도우미 ----
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error_json(self, status, message, headers=None):
+        self._send_json(status, {"error": message}, headers=headers)
+
+    def _parse_path(self):
+        """'/jobs/<id>[/<action>]' 경로를 (job_id, action)으로 분리. 형식이 다르면 None."""
+        parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+        if not parts or parts[0] != "jobs" or len(parts) > 3:
+            return None
+        if len(parts) == 1:
+            return None, None
+        try:
+            job_id = int(parts[1])
+        except ValueError:
+            return None
+        return job_id, parts[2] if len(parts) == 3 else None
+
+    def _get_job_or_404(self, job_id):
+        job = self.server.manager.get(job_id)
+        if job is None:
+            self._send_error_json(404, f"작업 {job_id}을(를) 찾을 수 없습니다.")
+        return job
+
+    # ---- 요청 처리 ----
+
+    def do_POST(self):
+        if self._parse_path() != (None, None):
+            self._send_error_json(404, "지원하지 않는 경로입니다.")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self._send_error_json(400, "Content-Length가 올바르지 않습니다.")
+            return
+        if length <= 0:
+            self._send_error_json(400, "요청 본문이 비어 있습니다.")
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_error_json(413, "업로드 크기 제한을 초과했습니다.")
+            return
+
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        body = self.rfile.read(length)
+        emphasis = exclude = None
+        uploaded_path = None
+
+        if content_type == "application/pdf":
+            fd, uploaded_path = tempfile.mkstemp(suffix=".pdf", dir=self.server.upload_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            pdf_path = uploaded_path
+        elif content_type == "application/json":
+            try:
+                request = json.loads(body)
+                pdf_path = request["path"]
+            except (ValueError, KeyError, TypeError):
+                self._send_error_json(400, "JSON 본문에 'path'가 필요합니다.")
+                return
+            if not isinstance(pdf_path, str):
+                self._send_error_json(400, "'path'는 문자열이어야 합니다.")
+                return
+            emphasis = request.get("emphasis")
+            exclude = request.get("exclude")
+            for name, value in (("emphasis", emphasis), ("exclude", exclude)):
+                if not _is_string_list(value):
+                    self._send_error_json(400, f"'{name}'은(는) 문자열 리스트여야 합니다.")
+                    return
+            if not os.path.isfile(pdf_path):
+                self._send_error_json(400, f"파일을 찾을 수 없습니다: {pdf_path}")
+                return
+        else:
+            self._send_error_json(415, "application/pdf 또는 application/json만 지원합니다.")
+            return
+
+        try:
+            job = self.server.manager.submit(pdf_path, emphasis=emphasis, exclude=exclude)
+        except QueueFull as e:
+            if uploaded_path:
+                os.remove(uploaded_path)
+            self._send_error_json(429, str(e), headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+            return
+
+        if uploaded_path:
+            self.server.uploads[job.job_id] = uploaded_path
+            if job.finished:
+                self.server.cleanup_upload(job.job_id)
+        self._send_json(202, job.to_dict(), headers={"Location": f"/jobs/{job.job_id}"})
+
+    def do_GET(self):
+        parsed = self._parse_path()
+        if parsed is None:
+            self._send_error_json(404, "지원하지 않는 경로입니다.")
+            return
+
+        job_id, action = parsed
+        if job_id is None:
+            self._send_json(200, [job.to_dict() for job in self.server.manager.jobs()])
+            return
+
+        job = self._get_job_or_404(job_id)
+        if job is None:
+            return
+
+        if action is None:
+            self._send_json(200, job.to_dict())
+        elif action == "result":
+            if job.status == DONE:
+                self._send_json(200, {"job_id": job.job_id, "title": job.title, "summary": job.summary})
+            elif job.status in (FAILED, CANCELLED):
+                self._send_error_json(410, job.error or "작업이 취소되었습니다.")
+            else:
+                self._send_error_json(409, "작업이 아직 완료되지 않았습니다.")
+        elif action == "events":
+            self._stream_events(job)
+        else:
+            self._send_error_json(404, "지원하지 않는 경로입니다.")
+
+    def do_DELETE(self):
+        parsed = self._parse_path()
+        if parsed is None or parsed[0] is None or parsed[1] is not None:
+            self._send_error_json(404, "지원하지 않는 경로입니다.")
+            return
+
+        job = self._get_job_or_404(parsed[0])
+        if job is None:
+            return
+
+        if job.finished:
+            self.server.manager.remove(job.job_id)
+            self._send_json(200, {"job_id": job.job_id, "removed": True})
+        else:
+            self.server.manager.cancel(job.job_id)
+            self._send_json(202, job.to_dict())
+
+    def _stream_events(self, job):
+        """상태가 바뀔 때마다 한 줄씩 JSON을 전송 (작업이 끝나면 종료)"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        last = None
+        try:
+            while True:
+                snapshot = job.to_dict()
+                if snapshot != last:
+                    self.wfile.write(json.dumps(snapshot, ensure_ascii=False).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                    last = snapshot
+                if job.finished:
+                    break
+                time.sleep(EVENT_POLL_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class SummaryServer(ThreadingHTTPServer):
+    """JobManager와 업로드 디렉토리를 공유하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, manager, upload_dir):
+        super().__init__(server_address, SummaryRequestHandler)
+        self.manager = manager
+        self.upload_dir = upload_dir
+        self.uploads = {}  # job_id -> 업로드된 임시 PDF 경로
+
+    def cleanup_upload(self, job_id):
+        """작업에 연결된 업로드 파일 삭제"""
+        path = self.uploads.pop(job_id, None)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def create_server(host="127.0.0.1", port=8080, max_workers=2, max_queue_depth=8, summarize_fn=generate_summary,
+                  max_finished_jobs=MAX_FINISHED_JOBS):
+    """
+    요약 서비스 서버를 생성합니다. serve_forever()로 실행하고, 종료 시 shutdown_server()를 호출합니다.
+
+    Args:
+        host (str): 바인딩할 주소
+        port (int): 포트 (0이면 임의의 빈 포트)
+        max_workers (int): 동시에 처리할 최대 작업 수
+        max_queue_depth (int): 대기열 최대 길이. 초과 시 429 응답
+        summarize_fn (coroutine function): 요약 백엔드 (기본값 generate_summary)
+        max_finished_jobs (int): 보관할 종료된 작업의 최대 수
+
+    Returns:
+        SummaryServer: 생성된 서버
+    """
+    upload_dir = tempfile.mkdtemp(prefix="pdf_summary_uploads_")
+    server = None
+
+    def on_update(job):
+        # 종료된 작업의 업로드 파일 정리
+        if job.finished and server is not None:
+            server.cleanup_upload(job.job_id)
+
+    manager = JobManager(max_workers=max_workers, on_update=on_update,
+                         max_queue_depth=max_queue_depth, summarize_fn=summarize_fn,
+                         max_finished_jobs=max_finished_jobs)
+    server = SummaryServer((host, port), manager, upload_dir)
+    return server
+
+
+def shutdown_server(server):
+    """서버, 작업 관리자, 업로드 디렉토리를 정리합니다."""
+    server.shutdown()
+    server.server_close()
+    server.manager.shutdown(wait=True)
+    shutil.rmtree(server.upload_dir, ignore_errors=True)
+
+
+def main():
+    """서비스 모드 실행"""
+    parser = argparse.ArgumentParser(description="PDF 요약 로컬 HTTP 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=2, help="동시에 처리할 최대 작업 수")
+    parser.add_argument("--max-queue", type=int, default=8, help="대기열 최대 길이 (초과 시 429)")
+    parser.add_argument("--max-finished", type=int, default=MAX_FINISHED_JOBS,
+                        help="보관할 종료된 작업의 최대 수 (초과 시 오래된 것부터 삭제)")
+    parser.add_argument("--fake-llm", action="store_true", help="OpenAI 대신 가짜 요약 백엔드 사용")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    summarize_fn = fake_generate_summary if args.fake_llm else generate_summary
+    server = create_server(args.host, args.port, max_workers=args.workers,
+                           max_queue_depth=args.max_queue, summarize_fn=summarize_fn,
+                           max_finished_jobs=args.max_finished)
+    logger.info("서비스 시작: http://%s:%d", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.manager.shutdown(wait=False)
+        shutil.rmtree(server.upload_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,28 @@ import asyncio
 import openai
 from openai import AsyncOpenAI
 
-client = AsyncOpenAI()
+_client = None
 
 logger = logging.getLogger(__name__)
 
-async def call_openai_api(prompt, max_tokens=500, temperature=0.7, retries=3):
-    """OpenAI API 호출 로직 (수정된 부분)"""
+def get_client():
+    """프로세스 전체에서 공유하는 AsyncOpenAI 클라이언트 (첫 사용 시 생성)"""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI()
+    return _client
+
+
+async def call_openai_api(prompt, max_tokens=500, temperature=0.7, retries=3, on_delta=None):
+    """
+    OpenAI API 호출 로직 (공유 AsyncOpenAI 클라이언트 사용)
+    on_delta가 주어지면 스트리밍 모드로 호출하고, 생성되는 조각마다 on_delta(조각)를 호출합니다.
+    스트리밍 도중 실패해 다시 시도할 때는 먼저 on_delta(None)을 호출하므로, 호출 측은 그때까지 받은 조각을 버려야 합니다.
+    """
     for attempt in range(retries):
+        parts = []
         try:
-            response = await openai.ChatCompletion.acreate(
+            response = await get_client().chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant."},
@@ -19,17 +32,32 @@ async def call_openai_api(prompt, max_tokens=500, temperature=0.7, retries=3):
                 ],
                 max_tokens=max_tokens,
                 temperature=temperature,
+                stream=on_delta is not None,
             )
-            return response["choices"][0]["message"]["content"].strip()
+            if on_delta is None:
+                return response.choices[0].message.content.strip()
+
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+            return "".join(parts).strip()
         except openai.OpenAIError as e:
             logger.warning(f"OpenAI API 호출 실패 (시도 {attempt + 1}/{retries}): {e}")
+            if parts:
+                # 실패한 시도에서 이미 전달한 조각을 버리도록 알림
+                on_delta(None)
             if attempt < retries - 1:
                 await asyncio.sleep(2)
             else:
                 logger.error("OpenAI API 호출 최대 시도 초과")
                 return "요약 생성 중 오류가 발생했습니다."
 
-async def generate_summary(text, title, ocr_text, keywords, emphasis=None, exclude=None, max_tokens=500, temperature=0.7):
+async def generate_summary(text, title, ocr_text, keywords, emphasis=None, exclude=None, max_tokens=500, temperature=0.7,
+                           on_delta=None):
     """요약 생성 (강조/제외 옵션 추가)"""
     combined_text = f"{title}\n\n{text}\n\n{ocr_text}"
     prompt = f"다음 텍스트를 요약해 주세요.\n"
@@ -38,7 +66,7 @@ async def generate_summary(text, title, ocr_text, keywords, emphasis=None, exclu
     if exclude:
         prompt += f"다음 주제를 제외해 주세요: {', '.join(exclude)}.\n"
     prompt += f"텍스트:\n{combined_text}"
-    return await call_openai_api(prompt, max_tokens=max_tokens, temperature=temperature)
+    return await call_openai_api(prompt, max_tokens=max_tokens, temperature=temperature, on_delta=on_delta)
 
 
 # async def call_openai_api(prompt, max_tokens=500, temperature=0.7, retries=3):
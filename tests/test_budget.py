@@ -0,0 +1,122 @@
+import io
+import threading
+import time
+
+import fitz
+import pytest
+from PIL import Image
+
+import extractor
+from budget import ProcessingBudget, BudgetCancelEvent, plan_pages, STOP_DEADLINE, STOP_MAX_PAGES, STOP_MAX_IMAGES
+from cancellation import JobCancelled
+
+PAGE_COUNT = 8
+
+
+def png_bytes(color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (120, 120), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """페이지마다 텍스트가 있고, 첫 페이지에 같은 이미지 두 개와 다른 이미지 하나가 있는 PDF"""
+    doc = fitz.open()
+    for number in range(1, PAGE_COUNT + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {number} doping concentration")
+    first = doc[0]
+    first.insert_image(fitz.Rect(72, 100, 192, 220), stream=png_bytes("red"))
+    first.insert_image(fitz.Rect(72, 240, 192, 360), stream=png_bytes("red"))
+    first.insert_image(fitz.Rect(72, 380, 192, 500), stream=png_bytes("blue"))
+    path = tmp_path / "doc.pdf"
+    doc.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    calls = []
+
+    def extract_text_from_image(image, cancel_event=None, **kwargs):
+        calls.append(image)
+        return "ocr text"
+
+    monkeypatch.setattr(extractor, "extract_text_from_image", extract_text_from_image)
+    return calls
+
+
+def run_budgeted(pdf_path, **limits):
+    budget = ProcessingBudget(**limits)
+    text, title, ocr_text = extractor.extract_pdf_content(pdf_path, budget=budget)
+    return budget.coverage
+
+
+def test_return_shape_does_not_depend_on_budget(pdf_path, fake_ocr):
+    plain = extractor.extract_pdf_content(pdf_path)
+    budgeted = extractor.extract_pdf_content(pdf_path, budget=ProcessingBudget())
+    assert len(plain) == len(budgeted) == 3
+    assert plain[0] == budgeted[0]
+
+
+def test_full_budget_is_complete_despite_duplicate_image(pdf_path, fake_ocr):
+    coverage = run_budgeted(pdf_path)
+    assert coverage.images_found == 3
+    assert coverage.images_dropped == 1
+    assert coverage.images_processed == 2
+    assert coverage.images_skipped == 0
+    assert coverage.stop_reason is None
+    assert coverage.complete
+
+
+def test_max_pages_sets_stop_reason(pdf_path, fake_ocr):
+    coverage = run_budgeted(pdf_path, max_pages=4)
+    assert len(coverage.processed_pages) == 4
+    assert coverage.stop_reason == STOP_MAX_PAGES
+    assert not coverage.complete
+
+
+def test_max_images_sets_stop_reason(pdf_path, fake_ocr):
+    coverage = run_budgeted(pdf_path, max_images=1)
+    assert coverage.images_processed == 1
+    assert coverage.images_skipped == 2
+    assert coverage.stop_reason == STOP_MAX_IMAGES
+
+
+def test_deadline_interrupts_running_ocr(pdf_path, monkeypatch):
+    def slow_ocr(image, cancel_event=None, **kwargs):
+        # run_tesseract_cancellable처럼 취소 이벤트를 주기적으로 확인
+        while not cancel_event.is_set():
+            time.sleep(0.01)
+        raise JobCancelled("작업이 취소되었습니다.")
+
+    monkeypatch.setattr(extractor, "extract_text_from_image", slow_ocr)
+    started = time.monotonic()
+    coverage = run_budgeted(pdf_path, deadline_seconds=1.0)
+    assert time.monotonic() - started < 5
+    assert coverage.stop_reason == STOP_DEADLINE
+    assert coverage.images_processed == 0
+
+
+@pytest.mark.parametrize("page_range", [(8, 3), (11, 12)])
+def test_invalid_page_range_raises(page_range):
+    with pytest.raises(ValueError):
+        plan_pages(10, [], ProcessingBudget(page_range=page_range))
+
+
+def test_page_range_is_clamped_to_document():
+    page_range, plan = plan_pages(10, [], ProcessingBudget(page_range=(0, 50)))
+    assert page_range == (1, 10)
+    assert sorted(plan) == list(range(10))
+
+
+def test_budget_cancel_event_follows_user_cancel():
+    budget = ProcessingBudget(deadline_seconds=60)
+    budget.start()
+    cancel_event = threading.Event()
+    assert not BudgetCancelEvent(budget, cancel_event).is_set()
+    cancel_event.set()
+    assert BudgetCancelEvent(budget, cancel_event).is_set()
+    budget.deadline_seconds = 0
+    assert BudgetCancelEvent(budget).is_set()
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import job_manager
+from cancellation import raise_if_cancelled
+from job_manager import JobManager, QUEUED, RUNNING, SUMMARIZING, DONE, CANCELLED
+from service import fake_generate_summary
+
+WAIT_TIMEOUT = 10
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """추출 단계를 가짜로 바꾸고, 이벤트가 설정될 때까지 작업을 실행 중 상태로 붙잡아 둠"""
+    gate = threading.Event()
+
+    def fake_extract(pdf_path, progress=None, cancel_event=None, **kwargs):
+        while not gate.wait(0.01):
+            raise_if_cancelled(cancel_event)
+        raise_if_cancelled(cancel_event)
+        return "quantum dot doping concentration results", "Test Title", "ocr text"
+
+    monkeypatch.setattr(job_manager, "extract_pdf_content", fake_extract)
+    yield gate
+    gate.set()
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("시간 안에 조건이 충족되지 않음")
+        time.sleep(0.01)
+
+
+def test_stream_reset_clears_partial_summary(release):
+    async def retrying_summary(text, title, ocr_text, keywords, on_delta=None, **kwargs):
+        on_delta("실패한 시도")
+        on_delta(None)
+        on_delta("최종 요약")
+        return "최종 요약"
+
+    summaries = []
+    manager = JobManager(max_workers=1, summarize_fn=retrying_summary,
+                         on_update=lambda job: summaries.append(job.summary))
+    try:
+        release.set()
+        job = manager.submit("doc.pdf")
+        wait_until(lambda: job.finished)
+        assert job.summary == "최종 요약"
+        streamed = summaries[summaries.index("실패한 시도"):]
+        assert streamed[:3] == ["실패한 시도", "", "최종 요약"]
+    finally:
+        manager.shutdown()
+
+
+def test_cancel_queued_job(release):
+    manager = JobManager(max_workers=1, summarize_fn=fake_generate_summary)
+    try:
+        running = manager.submit("first.pdf")
+        queued = manager.submit("second.pdf")
+        wait_until(lambda: running.status == RUNNING)
+        assert queued.status == QUEUED
+
+        assert manager.cancel(queued.job_id)
+        assert queued.status == CANCELLED
+
+        release.set()
+        wait_until(lambda: running.finished)
+        assert running.status == DONE
+        assert queued.status == CANCELLED
+        assert not manager.cancel(queued.job_id)
+    finally:
+        manager.shutdown()
+
+
+def test_cancel_while_summarizing_cancels_summary_future(release):
+    summary_started = threading.Event()
+    summary_cancelled = threading.Event()
+
+    async def slow_summary(*args, **kwargs):
+        summary_started.set()
+        try:
+            await asyncio.sleep(WAIT_TIMEOUT)
+        except asyncio.CancelledError:
+            summary_cancelled.set()
+            raise
+        return await fake_generate_summary(*args, **kwargs)
+
+    manager = JobManager(max_workers=1, summarize_fn=slow_summary)
+    try:
+        release.set()
+        job = manager.submit("doc.pdf")
+        assert summary_started.wait(WAIT_TIMEOUT)
+        assert job.status == SUMMARIZING
+
+        assert manager.cancel(job.job_id)
+        wait_until(lambda: job.finished)
+        assert job.status == CANCELLED
+        assert summary_cancelled.wait(WAIT_TIMEOUT)
+        assert job._summary_future is None
+    finally:
+        manager.shutdown()
+
+
+@pytest.mark.parametrize("wait", [True, False])
+def test_shutdown_closes_event_loop(wait):
+    manager = JobManager(max_workers=1, summarize_fn=fake_generate_summary)
+    manager.shutdown(wait=wait)
+    wait_until(manager.loop.is_closed)
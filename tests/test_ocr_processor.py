@@ -0,0 +1,92 @@
+import io
+import sys
+import threading
+import time
+
+import pytest
+import pytesseract
+from PIL import Image, ImageDraw, ImageFont
+
+from cancellation import JobCancelled
+from ocr_processor import run_tesseract_cancellable, prepare_tesseract_input, extract_text_from_image, preprocess_image
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="가짜 tesseract 스크립트는 POSIX 전용")
+
+
+def fake_tesseract(monkeypatch, tmp_path, script):
+    path = tmp_path / "tesseract"
+    path.write_text("#!/bin/sh\n" + script)
+    path.chmod(0o755)
+    monkeypatch.setattr(pytesseract.pytesseract, "tesseract_cmd", str(path))
+
+
+def test_returns_stdout(monkeypatch, tmp_path):
+    fake_tesseract(monkeypatch, tmp_path, "echo 'hello 2024'\n")
+    text = run_tesseract_cancellable(Image.new("L", (10, 10)), "eng", "--psm 6", threading.Event())
+    assert text.strip() == "hello 2024"
+
+
+@pytest.mark.parametrize("mode", ["CMYK", "RGBA", "LA", "I;16"])
+def test_accepts_modes_png_cannot_store(monkeypatch, tmp_path, mode):
+    fake_tesseract(monkeypatch, tmp_path, "echo ok\n")
+    image = Image.new("RGB", (10, 10), (200, 30, 30)).convert(mode)
+    assert run_tesseract_cancellable(image, "eng", "", threading.Event()).strip() == "ok"
+
+
+def test_cancel_stops_orientation_detection(monkeypatch, tmp_path):
+    fake_tesseract(monkeypatch, tmp_path, 'echo "$@" > "$(dirname "$0")/args"\nexec sleep 10\n')
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    started = time.monotonic()
+    with pytest.raises(JobCancelled):
+        preprocess_image(Image.new("L", (50, 50), 255), cancel_event)
+    assert time.monotonic() - started < 5
+    assert "--psm 0" in (tmp_path / "args").read_text()
+
+
+def cmyk_jpeg_with_text():
+    image = Image.new("RGB", (600, 200), "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=24)
+    for row in range(3):
+        draw.text((20, 20 + row * 50), "Doping concentration 2024", fill="black", font=font)
+    buffer = io.BytesIO()
+    image.convert("CMYK").save(buffer, format="JPEG")
+    return Image.open(io.BytesIO(buffer.getvalue()))
+
+
+def test_cmyk_jpeg_with_cancel_event(monkeypatch, tmp_path):
+    fake_tesseract(monkeypatch, tmp_path, "echo 'Doping concentration 2024'\n")
+    image = cmyk_jpeg_with_text()
+    assert image.mode == "CMYK"
+    assert extract_text_from_image(image, cancel_event=threading.Event()).startswith("Doping concentration 2024")
+
+
+def test_cmyk_jpeg_without_cancel_event(monkeypatch, tmp_path):
+    # pytesseract 경로: 결과를 <출력 경로>.txt 파일로 기록
+    fake_tesseract(monkeypatch, tmp_path, 'case "$1" in *.PNG|*.png) ;; *) exit 1 ;; esac\n'
+                                          "echo 'Doping concentration 2024' > \"$2.txt\"\n")
+    assert extract_text_from_image(cmyk_jpeg_with_text()).startswith("Doping concentration 2024")
+
+
+def test_prepare_flattens_alpha_on_white():
+    image = Image.new("RGBA", (4, 4), (0, 0, 0, 0))
+    prepared = prepare_tesseract_input(image)
+    assert prepared.mode == "RGB"
+    assert prepared.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_nonzero_exit_raises_tesseract_error(monkeypatch, tmp_path):
+    fake_tesseract(monkeypatch, tmp_path, "echo 'Failed loading language kor' >&2\nexit 1\n")
+    with pytest.raises(pytesseract.TesseractError) as info:
+        run_tesseract_cancellable(Image.new("L", (10, 10)), "kor", "", threading.Event())
+    assert info.value.status == 1
+    assert "Failed loading language kor" in info.value.message
+
+
+def test_cancel_kills_process(monkeypatch, tmp_path):
+    fake_tesseract(monkeypatch, tmp_path, "exec sleep 10\n")
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    with pytest.raises(JobCancelled):
+        run_tesseract_cancellable(Image.new("L", (10, 10)), "eng", "", cancel_event, poll_interval=0.05)
@@ -0,0 +1,163 @@
+import http.client
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import job_manager
+from cancellation import raise_if_cancelled
+from job_manager import JobManager
+from service import create_server, shutdown_server, fake_generate_summary, RETRY_AFTER_SECONDS
+
+WAIT_TIMEOUT = 10
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """추출 단계를 가짜로 바꾸고, 이벤트가 설정될 때까지 작업을 실행 중 상태로 붙잡아 둠"""
+    gate = threading.Event()
+
+    def fake_extract(pdf_path, progress=None, cancel_event=None, **kwargs):
+        while not gate.wait(0.01):
+            raise_if_cancelled(cancel_event)
+        raise_if_cancelled(cancel_event)
+        return "quantum dot doping concentration results", "Test Title", "ocr text"
+
+    monkeypatch.setattr(job_manager, "extract_pdf_content", fake_extract)
+    yield gate
+    gate.set()
+
+
+@pytest.fixture
+def server(release):
+    srv = create_server(port=0, max_workers=1, max_queue_depth=1, summarize_fn=fake_generate_summary)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    shutdown_server(srv)
+    thread.join(WAIT_TIMEOUT)
+
+
+def request(srv, method, path, body=None, content_type=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.server_address[1], timeout=WAIT_TIMEOUT)
+    headers = {"Content-Type": content_type} if content_type else {}
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    payload = json.loads(response.read() or b"null")
+    conn.close()
+    return response, payload
+
+
+def upload(srv):
+    return request(srv, "POST", "/jobs", body=b"%PDF-1.4 fake", content_type="application/pdf")
+
+
+def wait_for_status(srv, job_id, statuses):
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        _, job = request(srv, "GET", f"/jobs/{job_id}")
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"작업 {job_id}이(가) {statuses} 상태가 되지 않음: {job['status']}")
+
+
+def test_upload_then_result(server, release):
+    response, job = upload(server)
+    assert response.status == 202
+    assert response.getheader("Location") == f"/jobs/{job['job_id']}"
+
+    release.set()
+    assert wait_for_status(server, job["job_id"], ["done"])["status"] == "done"
+
+    response, result = request(server, "GET", f"/jobs/{job['job_id']}/result")
+    assert response.status == 200
+    assert result["title"] == "Test Title"
+    assert result["summary"].startswith("Test Title")
+
+
+def test_result_before_finish_is_conflict(server):
+    _, job = upload(server)
+    response, _ = request(server, "GET", f"/jobs/{job['job_id']}/result")
+    assert response.status == 409
+
+
+def test_queue_full_returns_429(server):
+    # max_workers(1) + max_queue_depth(1)개가 활성 상태면 새 작업 거부
+    for _ in range(2):
+        response, _ = upload(server)
+        assert response.status == 202
+
+    response, payload = upload(server)
+    assert response.status == 429
+    assert response.getheader("Retry-After") == str(RETRY_AFTER_SECONDS)
+    assert "error" in payload
+    # 거부된 업로드는 디스크에 남지 않음
+    assert len(os.listdir(server.upload_dir)) == 2
+
+
+def test_delete_running_job_cancels(server):
+    _, job = upload(server)
+    wait_for_status(server, job["job_id"], ["running"])
+
+    response, _ = request(server, "DELETE", f"/jobs/{job['job_id']}")
+    assert response.status == 202
+    assert wait_for_status(server, job["job_id"], ["cancelled", "done", "failed"])["status"] == "cancelled"
+
+    response, _ = request(server, "GET", f"/jobs/{job['job_id']}/result")
+    assert response.status == 410
+
+
+def test_upload_removed_after_job_finishes(server, release):
+    _, job = upload(server)
+    uploaded_path = server.uploads[job["job_id"]]
+    assert os.path.isfile(uploaded_path)
+
+    release.set()
+    wait_for_status(server, job["job_id"], ["done"])
+    assert not os.path.exists(uploaded_path)
+    assert os.listdir(server.upload_dir) == []
+
+
+@pytest.mark.parametrize("body", [
+    {"path": None},
+    {"path": 3},
+    {"path": ["a.pdf"]},
+    {"path": {"file": "a.pdf"}},
+    {"path": __file__, "emphasis": "doping"},
+    {"path": __file__, "exclude": ["ok", 1]},
+])
+def test_invalid_json_request_returns_400(server, body):
+    response, payload = request(server, "POST", "/jobs", body=json.dumps(body), content_type="application/json")
+    assert response.status == 400
+    assert "error" in payload
+
+
+def test_finished_jobs_are_pruned(release):
+    release.set()
+    manager = JobManager(max_workers=1, summarize_fn=fake_generate_summary, max_finished_jobs=2)
+    try:
+        jobs = [manager.submit(f"doc{i}.pdf") for i in range(4)]
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while not all(job.finished for job in jobs) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert all(job.status == "done" for job in jobs)
+        assert [job.job_id for job in manager.jobs()] == [job.job_id for job in jobs[-2:]]
+    finally:
+        manager.shutdown()
+
+
+def test_invalid_content_length_returns_400(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=WAIT_TIMEOUT)
+    conn.putrequest("POST", "/jobs")
+    conn.putheader("Content-Type", "application/pdf")
+    conn.putheader("Content-Length", "abc")
+    conn.endheaders()
+    response = conn.getresponse()
+    payload = json.loads(response.read())
+    conn.close()
+
+    assert response.status == 400
+    assert "error" in payload
@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+import summarizer
+
+
+def chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FlakyStreamClient:
+    """첫 번째 스트림은 조각 하나를 보낸 뒤 끊기고, 두 번째 스트림은 끝까지 전달되는 가짜 클라이언트"""
+
+    def __init__(self):
+        self.attempts = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.attempts += 1
+        attempt = self.attempts
+
+        async def stream():
+            if attempt == 1:
+                yield chunk("끊긴 ")
+                raise openai.APIConnectionError(request=httpx.Request("POST", "http://test"))
+            for content in ("요약", " 결과"):
+                yield chunk(content)
+
+        return stream()
+
+
+def test_stream_retry_resets_partial_output(monkeypatch):
+    client = FlakyStreamClient()
+    monkeypatch.setattr(summarizer, "get_client", lambda: client)
+
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(summarizer.asyncio, "sleep", no_sleep)
+
+    received = []
+    shown = []
+
+    def on_delta(delta):
+        received.append(delta)
+        if delta is None:
+            shown.clear()
+        else:
+            shown.append(delta)
+
+    result = asyncio.run(summarizer.call_openai_api("prompt", on_delta=on_delta))
+
+    assert client.attempts == 2
+    assert received == ["끊긴 ", None, "요약", " 결과"]
+    assert "".join(shown) == result == "요약 결과"
@@ -0,0 +1,33 @@
+import pytest
+
+from text_normalizer import clean_document_text, normalize_ocr_text, clean_chunks
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2OO4년", "2004년"),
+    ("1OO개", "100개"),
+    ("3.l4%", "3.14%"),
+    ("10:3O", "10:30"),
+    ("2O24-O1-15", "2024-01-15"),
+    ("ㄱㅏ나다", "가나다"),
+    # 숫자가 없거나 영단어에 붙은 토큰은 그대로
+    ("Oliver I lO", "Oliver I lO"),
+    ("10lbs 2Oxide", "10lbs 2Oxide"),
+    # 혼동 문자로 시작하는 화학식은 그대로, 숫자가 대부분인 토큰은 교정
+    ("O2 plasma", "O2 plasma"),
+    ("O3 and I2 gas", "O3 and I2 gas"),
+    ("lO2", "lO2"),
+    ("l00 nm", "100 nm"),
+    ("O1-15", "01-15"),
+])
+def test_normalize_ocr_text(text, expected):
+    assert normalize_ocr_text(text) == expected
+
+
+def test_clean_document_text_drops_page_numbers_and_math():
+    text = "결과는 Page 12\n다음과 같다 $x^2$  입니다. HomePage 3"
+    assert clean_document_text(text) == "결과는 다음과 같다 입니다. HomePage 3"
+
+
+def test_clean_chunks_skips_empty_chunks():
+    assert clean_chunks(["  첫 페이지 \n", "Page 2", "둘째\t페이지"]) == "첫 페이지 둘째 페이지"
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from text_region_detector import detect_text_regions, crop_text_regions, union_area, CROP_PADDING
+
+A4_INCHES = (8.27, 11.69)
+LINE_TEXT = "The quick brown fox jumps over the lazy dog 12345"
+
+
+def render_page(dpi, point_size, line_spacing=1.6):
+    """A4 페이지에 같은 간격의 텍스트 줄을 그리고 (이미지, 줄 상자 리스트)를 반환"""
+    size = (int(A4_INCHES[0] * dpi), int(A4_INCHES[1] * dpi))
+    px = int(point_size * dpi / 72)
+    font = ImageFont.load_default(size=px)
+    image = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(image)
+
+    margin = int(dpi)  # 1인치 여백
+    line_boxes = []
+    y = margin
+    while y + px < size[1] - margin:
+        draw.text((margin, y), LINE_TEXT, fill=0, font=font)
+        line_boxes.append(draw.textbbox((margin, y), LINE_TEXT, font=font))
+        y += int(px * line_spacing)
+    return image, line_boxes
+
+
+def is_covered(line_box, boxes):
+    left, top, right, bottom = line_box
+    return any(bl <= left and bt <= top and br >= right and bb >= bottom for bl, bt, br, bb in boxes)
+
+
+@pytest.mark.parametrize("dpi", [150, 300])
+@pytest.mark.parametrize("point_size", [6, 8, 10, 12])
+def test_every_text_line_is_covered(dpi, point_size):
+    image, line_boxes = render_page(dpi, point_size)
+    boxes = detect_text_regions(image)
+
+    missed = [box for box in line_boxes if not is_covered(box, boxes)]
+    assert not missed, f"{len(missed)}/{len(line_boxes)} 줄이 텍스트 영역에 포함되지 않음"
+
+
+def test_blank_image_has_no_regions():
+    assert detect_text_regions(Image.new("L", (800, 600), 255)) == []
+
+
+def test_line_drawing_without_text_has_no_regions():
+    image = Image.new("L", (800, 600), 255)
+    draw = ImageDraw.Draw(image)
+    for k in range(10):
+        draw.line([(0, k * 60), (800, 600 - k * 60)], fill=0, width=2)
+
+    assert detect_text_regions(image) == []
+
+
+def test_plot_without_text_has_no_regions():
+    image = Image.new("L", (800, 600), 255)
+    draw = ImageDraw.Draw(image)
+    draw.line([(60, 540), (780, 540)], fill=0, width=2)
+    draw.line([(60, 20), (60, 540)], fill=0, width=2)
+    for k in range(10):
+        draw.line([(60 + k * 72, 540), (60 + k * 72, 548)], fill=0, width=2)
+        draw.line([(52, 540 - k * 52), (60, 540 - k * 52)], fill=0, width=2)
+    xs = np.linspace(60, 780, 400)
+    draw.line(list(zip(xs, 280 + 150 * np.sin(xs / 50))), fill=0, width=2)
+
+    assert detect_text_regions(image) == []
+
+
+@pytest.mark.parametrize("blur", [1, 2, 4])
+def test_photo_has_no_regions(blur):
+    noise = np.random.default_rng(0).integers(0, 256, (600, 800), dtype=np.uint8)
+    image = Image.fromarray(noise).filter(ImageFilter.GaussianBlur(blur))
+
+    assert detect_text_regions(image) == []
+
+
+def test_text_on_page_with_photo_is_found():
+    image, line_boxes = render_page(150, 10)
+    noise = np.random.default_rng(0).integers(0, 256, (image.height // 2, image.width - 300), dtype=np.uint8)
+    image.paste(Image.fromarray(noise).filter(ImageFilter.GaussianBlur(1.5)), (150, image.height // 2))
+    boxes = detect_text_regions(image)
+
+    text_lines = [box for box in line_boxes if box[3] < image.height // 2]
+    assert all(is_covered(box, boxes) for box in text_lines)
+    assert all(bottom <= image.height // 2 + CROP_PADDING for _left, _top, _right, bottom in boxes)
+
+
+def test_union_area_counts_overlap_once():
+    assert union_area([]) == 0
+    assert union_area([(0, 0, 10, 10), (5, 5, 15, 15)]) == 175
+    assert union_area([(0, 0, 10, 10), (0, 0, 10, 10), (2, 2, 4, 4)]) == 100
+
+
+@pytest.mark.parametrize("mode, expected", [("CMYK", "RGB"), ("L", "L"), ("RGBA", "RGBA"), ("YCbCr", "RGB")])
+def test_crops_can_be_saved_as_png(tmp_path, mode, expected):
+    image = Image.new("RGB", (40, 30), (200, 30, 30)).convert(mode)
+    crops = crop_text_regions(image, [(0, 0, 20, 10), (10, 10, 40, 30)])
+
+    assert [crop.size for crop in crops] == [(20, 10), (30, 20)]
+    for crop in crops:
+        assert crop.mode == expected
+        crop.save(tmp_path / "crop.png")
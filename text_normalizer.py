@@ -0,0 +1,109 @@
+"""
+파일 이름: text_normalizer.py
+설명: 이 파일은 PDF/OCR 텍스트 정규화 규칙을 미리 컴파일해 최소한의 패스로 적용하는 엔진을 제공합니다.
+여러 정규식을 차례로 적용하던 방식 대신, 제거 규칙과 OCR 교정 규칙은 각각 하나로 합친 정규식으로,
+공백 정리는 str.split/join 한 번으로, 숫자 토큰 안의 문자 치환은 str.translate 테이블로 처리합니다.
+페이지 단위 청크에 대해서도 점진적으로 적용할 수 있습니다.
+"""
+
+import re
+
+# 제거 규칙 (한 번의 패스): 페이지 번호 "\bPage\s?\d+\b" | LaTeX 인라인 수식 "\$.*?\$"
+# 최상위를 단일 문자 집합으로 시작해야 정규식 엔진이 후보 위치로 빠르게 건너뛸 수 있습니다.
+_DROP_RE = re.compile(r'[P$](?:(?<=P)(?<!\wP)age\s?\d+\b|(?<=\$).*?\$)')
+
+# 한글 호환 자모 → 초성/중성 인덱스
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_CHOSEONG_INDEX = {c: i for i, c in enumerate(_CHOSEONG)}
+_JUNGSEONG_INDEX = {v: i for i, v in enumerate(_JUNGSEONG)}
+
+# 숫자 토큰 안의 OCR 혼동 문자 치환 테이블 (O/o → 0, l/I → 1)
+_DIGIT_TABLE = str.maketrans("oOlI", "0011")
+
+# OCR 후처리 규칙 (한 번의 패스): 분리된 자모 결합 | 혼동 문자(O/l/I)가 섞인 숫자 토큰
+# 제거 규칙과 같은 이유로 두 규칙을 최상위 alternation 대신 첫 글자 뒤의 분기로 합칩니다.
+_NUM_CHARS = r'0-9oOlI'
+_OCR_FIX_RE = re.compile(rf"""
+    [{_CHOSEONG}{_NUM_CHARS}]
+    (?:
+        (?<=[{_CHOSEONG}])(?P<jamo>[{_JUNGSEONG}])            # 초성 + 중성
+      |
+        (?<![\w][{_NUM_CHARS}])(?<=[{_NUM_CHARS}])             # 토큰 시작
+        (?:(?<=[0-9])|(?=[{_NUM_CHARS}.,:/\-]*[0-9]))         # 숫자 포함
+        (?:(?<=[oOlI])|(?=[{_NUM_CHARS}.,:/\-]*[oOlI]))       # 혼동 문자 포함
+        [{_NUM_CHARS}]*(?:[.,:/\-][{_NUM_CHARS}]+)*(?![{_NUM_CHARS}A-Za-z])   # 토큰 끝 (한글 조사/단위는 붙어도 됨)
+    )
+""", re.VERBOSE)
+
+
+def _fix_ocr_match(match):
+    token = match.group()
+    if match.group('jamo'):
+        return chr(ord('가') + _CHOSEONG_INDEX[token[0]] * 21 * 28 + _JUNGSEONG_INDEX[token[1]] * 28)
+    digits = sum(ch.isdigit() for ch in token)
+    confusables = sum(ch in 'oOlI' for ch in token)
+    # 역추적으로 숫자 없는 앞부분만 잡힌 경우(예: "lO-5x"의 "lO")는 그대로 둠
+    if digits == 0:
+        return token
+    # 혼동 문자로 시작하는 토큰은 숫자가 더 많을 때만 숫자로 봄 ("O2", "I2" 같은 화학식 보존)
+    if not token[0].isdigit() and digits <= confusables:
+        return token
+    return token.translate(_DIGIT_TABLE)
+
+
+def collapse_whitespace(text):
+    """모든 공백(줄바꿈 포함)을 한 칸으로 줄이고 앞뒤 공백을 제거"""
+    return " ".join(text.split())
+
+
+def clean_document_text(text):
+    """
+    문서 텍스트 클렌징 (페이지 번호, LaTeX 수식 제거 후 공백 정리)
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정리된 텍스트
+    """
+    # 제거 대상이 없으면 정규식 패스 자체를 생략
+    if '$' in text or 'Page' in text:
+        text = _DROP_RE.sub('', text)
+    return collapse_whitespace(text)
+
+
+def normalize_ocr_text(text):
+    """
+    OCR 결과 후처리 (공백 정리, 자모 결합, 숫자 토큰 안의 O/l/I 교정)
+
+    Args:
+        text (str): OCR 원본 텍스트
+
+    Returns:
+        str: 정리된 텍스트
+    """
+    return _OCR_FIX_RE.sub(_fix_ocr_match, collapse_whitespace(text))
+
+
+def iter_clean_chunks(chunks, normalizer=clean_document_text):
+    """
+    페이지 등 공백 경계로 나뉜 청크를 하나씩 정규화합니다.
+    전체 문자열을 한 번에 만들지 않고 청크 단위로 처리할 때 사용합니다.
+
+    Args:
+        chunks (iterable): 텍스트 청크
+        normalizer (callable): 청크에 적용할 정규화 함수
+
+    Yields:
+        str: 비어 있지 않은 정규화된 청크
+    """
+    for chunk in chunks:
+        cleaned = normalizer(chunk)
+        if cleaned:
+            yield cleaned
+
+
+def clean_chunks(chunks, normalizer=clean_document_text):
+    """청크들을 정규화해 공백 한 칸으로 이어 붙인 문자열을 반환"""
+    return " ".join(iter_clean_chunks(chunks, normalizer))
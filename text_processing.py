@@ -6,22 +6,24 @@ TF-IDF 분석을 통해 중요한 키워드를 추출하는 기능을 제공합
 import re
 from sklearn.feature_extraction.text import TfidfVectorizer
 import numpy as np
+from text_normalizer import clean_document_text, clean_chunks
 
 def advanced_clean_text(text):
-    """텍스트 클렌징 (수식, 페이지 번호 등 제거)"""
-    # 페이지 번호 제거
-    text = re.sub(r'\bPage\s?\d+\b', '', text)
-    # 수식 제거
-    text = re.sub(r'\$.*?\$', '', text)  # LaTeX 형식
-    # 중복 공백 제거
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    """텍스트 클렌징 (수식, 페이지 번호 등 제거, 공백 정리를 한 번의 정규화 엔진 호출로 처리)"""
+    return clean_document_text(text)
 
 def clean_text(text):
     """기존 클렌징 함수와 통합"""
     cleaned = advanced_clean_text(text)
     return cleaned
 
+def clean_text_chunks(chunks):
+    """
+    여러 텍스트 조각(페이지 텍스트, OCR 텍스트 등)을 이어 붙이지 않고 조각별로 클렌징한 뒤 결합합니다.
+    조각 경계에 걸친 페이지 번호/수식이 없다면 clean_text(" ".join(chunks))와 같은 결과를 반환합니다.
+    """
+    return clean_chunks(chunks)
+
 def extract_key_sentences(text, num_sentences=3):
     """중요 문장을 TF-IDF로 추출"""
     sentences = text.split(". ")
@@ -0,0 +1,213 @@
+"""
+파일 이름: text_region_detector.py
+설명: 이 파일은 OCR 전에 이미지에서 텍스트가 있을 법한 영역을 빠르게 찾는 기능을 제공합니다.
+모폴로지 그래디언트로 글자 경계를 찾고, 가로로 이어 붙인 뒤 연결 요소(connected components)를
+텍스트 줄 모양(높이, 가로세로 비율, 채움 비율, 글자 정렬)과 명암 분포(균일한 배경 위의 글자)로 걸러
+텍스트 블록 좌표를 반환합니다. 사진, 그래프, 도형처럼 텍스트 줄이 없는 이미지는 빈 리스트를 반환합니다.
+"""
+
+import numpy as np
+from scipy import ndimage
+
+# 탐지는 축소된 이미지에서 수행 (긴 변 기준 최대 픽셀)
+DETECTION_MAX_SIDE = 1600
+# 축소 후 글자 높이가 이보다 작으면 더 큰 해상도(최대 원본)에서 다시 탐지
+MIN_DETECTION_CHAR_HEIGHT = 10
+# 그래디언트 이진화 최소 임계값 (평탄한 이미지의 잡음 무시)
+MIN_GRADIENT_THRESHOLD = 30
+# 글자 높이 추정에 사용할 에지 연결 요소의 최소 높이 (탐지 해상도 픽셀)
+MIN_CHAR_COMPONENT_HEIGHT = 3
+# 텍스트 줄 후보 조건 (추정 글자 높이 h에 대한 비율)
+MIN_LINE_HEIGHT_RATIO = 0.5   # 최소 줄 높이 = 0.5h
+MAX_LINE_HEIGHT_RATIO = 0.25  # 이미지 높이 대비 최대 줄 높이
+MIN_LINE_ASPECT = 1.5         # 너비 / 높이
+# 상자 안 에지 픽셀 최소 비율 (작은 글자는 에지가 글자 전체를 덮으므로 상한은 두지 않음)
+MIN_FILL_RATIO = 0.15
+# 한 줄을 이루는 최소 글자(에지 연결 요소) 수, 줄 높이 / 글자 높이 중앙값의 최대값 (글자들이 한 줄에 정렬됨)
+MIN_LINE_GLYPHS = 2
+MAX_LINE_GLYPH_RATIO = 1.7
+# 줄 상자의 명암 분포 조건: 글자/배경 두 부류로 잘 나뉘고(Otsu 분리도), 배경이 균일해야 함 (배경 표준편차 / 대비)
+MIN_SEPARABILITY = 0.8
+MAX_BACKGROUND_SPREAD = 0.22
+# 줄 모양 후보 중 텍스트 줄로 확인된 비율이 이보다 낮으면 질감(사진 등)으로 보고 버림
+MIN_TEXT_LINE_SHARE = 0.1
+# 글자/단어를 가로로 이을 때의 커널 너비, 줄을 블록으로 묶을 때의 세로 간격 (h에 대한 비율)
+WORD_GAP_RATIO = 1.0
+LINE_GAP_RATIO = 1.0
+# 크롭 시 여백 (원본 픽셀)
+CROP_PADDING = 4
+
+
+def _otsu_threshold(values):
+    """uint8 배열에 대한 Otsu 임계값"""
+    hist = np.bincount(values.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    if total == 0:
+        return 0
+    bins = np.arange(256)
+    weight_bg = np.cumsum(hist)
+    weight_fg = total - weight_bg
+    sum_bg = np.cumsum(hist * bins)
+    mean_bg = sum_bg / np.maximum(weight_bg, 1)
+    mean_fg = (sum_bg[-1] - sum_bg) / np.maximum(weight_fg, 1)
+    between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return int(np.argmax(between))
+
+
+def _to_gray_array(image, max_side):
+    """PIL 이미지를 탐지용 그레이스케일 배열로 변환하고 축소 배율을 반환"""
+    gray = image.convert("L")
+    scale = min(1.0, max_side / max(gray.size))
+    if scale < 1.0:
+        gray = gray.resize((max(1, int(gray.width * scale)), max(1, int(gray.height * scale))))
+    return np.asarray(gray, dtype=np.uint8), scale
+
+
+def _edge_map(gray):
+    """모폴로지 그래디언트 → 글자 경계 이진 맵"""
+    gradient = ndimage.morphological_gradient(gray, size=(3, 3))
+    threshold = max(_otsu_threshold(gradient), MIN_GRADIENT_THRESHOLD)
+    return gradient > threshold
+
+
+def _estimate_char_height(edges):
+    """에지 연결 요소(대부분 글자 하나)의 높이 중앙값으로 글자 높이를 추정. 추정할 수 없으면 None."""
+    labels, count = ndimage.label(edges)
+    if count == 0:
+        return None
+    heights = [rows.stop - rows.start for rows, _cols in ndimage.find_objects(labels)]
+    heights = [h for h in heights if h >= MIN_CHAR_COMPONENT_HEIGHT]
+    if not heights:
+        return None
+    return float(np.median(heights))
+
+
+def _intensity_split(values):
+    """
+    줄 상자 픽셀을 Otsu로 두 부류로 나눠 (분리도, 배경 퍼짐)을 반환.
+    분리도는 전체 분산 중 부류 간 분산의 비율(1에 가까울수록 두 값으로 뚜렷이 나뉨),
+    배경 퍼짐은 픽셀이 더 많은 부류(배경)의 표준편차를 두 부류 평균 차이로 나눈 값입니다.
+    """
+    values = values.ravel()
+    threshold = _otsu_threshold(values)
+    low = values[values <= threshold].astype(np.float64)
+    high = values[values > threshold].astype(np.float64)
+    if low.size == 0 or high.size == 0:
+        return 0.0, np.inf
+    contrast = high.mean() - low.mean()
+    between = low.size * high.size / values.size ** 2 * contrast ** 2
+    background = low if low.size >= high.size else high
+    return between / values.astype(np.float64).var(), background.std() / contrast
+
+
+def detect_text_regions(image):
+    """
+    이미지에서 텍스트가 있을 법한 영역을 찾습니다.
+    커널 크기와 줄 높이 조건은 추정한 글자 높이에 맞춰 정하므로 해상도(DPI)와 무관하게 동작하며,
+    글자가 너무 작게 잡히면 탐지 해상도를 올려 다시 찾습니다.
+
+    Args:
+        image (PIL.Image.Image): 입력 이미지
+
+    Returns:
+        list: 원본 이미지 좌표의 (left, top, right, bottom) 상자 리스트 (위→아래, 왼쪽→오른쪽 순).
+            텍스트 줄로 확인된 영역이 없으면(빈 이미지, 사진, 그래프 등) 빈 리스트.
+    """
+    original_width, original_height = image.size
+
+    gray, scale = _to_gray_array(image, DETECTION_MAX_SIDE)
+    edges = _edge_map(gray)
+    if not edges.any():
+        return []
+
+    char_height = _estimate_char_height(edges)
+    if char_height is not None and char_height < MIN_DETECTION_CHAR_HEIGHT and scale < 1.0:
+        # 글자가 너무 작게 잡히면 줄 사이가 붙으므로 필요한 만큼 해상도를 올려 다시 탐지
+        max_side = DETECTION_MAX_SIDE * MIN_DETECTION_CHAR_HEIGHT / char_height
+        gray, scale = _to_gray_array(image, max_side)
+        edges = _edge_map(gray)
+        char_height = _estimate_char_height(edges)
+    if char_height is None:
+        return []
+
+    height, width = gray.shape
+
+    # 글자들을 가로로만 이어 텍스트 줄로 만들기 (세로로 이으면 인접한 줄이 합쳐짐)
+    word_gap = max(3, int(round(char_height * WORD_GAP_RATIO)))
+    line_mask = ndimage.binary_closing(edges, structure=np.ones((1, word_gap), dtype=bool))
+    labels, count = ndimage.label(line_mask)
+    glyph_labels, _ = ndimage.label(edges)
+    glyph_heights = np.array([rows.stop - rows.start for rows, _cols in ndimage.find_objects(glyph_labels)])
+
+    min_line_height = max(MIN_CHAR_COMPONENT_HEIGHT, char_height * MIN_LINE_HEIGHT_RATIO)
+    max_line_height = max(min_line_height, height * MAX_LINE_HEIGHT_RATIO)
+    lines = np.zeros_like(line_mask)
+    line_count = 0
+    candidate_count = 0
+    for index, region in enumerate(ndimage.find_objects(labels), start=1):
+        rows, cols = region
+        box_height = rows.stop - rows.start
+        box_width = cols.stop - cols.start
+        if not min_line_height <= box_height <= max_line_height:
+            continue
+        if box_width < box_height * MIN_LINE_ASPECT:
+            continue
+        component = labels[region] == index
+        if edges[region][component].mean() < MIN_FILL_RATIO:
+            continue
+        candidate_count += 1
+
+        # 글자들이 한 줄에 정렬되어 있는지 (줄 높이가 글자 높이와 비슷한지)
+        glyphs = np.unique(glyph_labels[region][component])
+        glyphs = glyphs[glyphs > 0]
+        if glyphs.size < MIN_LINE_GLYPHS:
+            continue
+        if box_height > np.median(glyph_heights[glyphs - 1]) * MAX_LINE_GLYPH_RATIO:
+            continue
+        # 균일한 배경 위의 글자인지 (사진의 질감은 명암이 연속적으로 퍼져 있음)
+        separability, background_spread = _intensity_split(gray[region])
+        if separability < MIN_SEPARABILITY or background_spread > MAX_BACKGROUND_SPREAD:
+            continue
+        lines[region] |= component
+        line_count += 1
+
+    if line_count == 0 or line_count < candidate_count * MIN_TEXT_LINE_SHARE:
+        return []
+
+    # 줄 간격 정도 떨어진 줄들을 묶어 텍스트 블록 생성 (OCR 호출 수 감소)
+    line_gap = max(3, int(round(char_height * LINE_GAP_RATIO)))
+    structure = np.ones((line_gap, word_gap), dtype=bool)
+    blocks, _ = ndimage.label(ndimage.binary_dilation(lines, structure=structure))
+    boxes = []
+    for rows, cols in ndimage.find_objects(blocks):
+        left = max(0, int(cols.start / scale) - CROP_PADDING)
+        top = max(0, int(rows.start / scale) - CROP_PADDING)
+        right = min(original_width, int(np.ceil(cols.stop / scale)) + CROP_PADDING)
+        bottom = min(original_height, int(np.ceil(rows.stop / scale)) + CROP_PADDING)
+        boxes.append((left, top, right, bottom))
+
+    return sorted(boxes, key=lambda b: (b[1], b[0]))
+
+
+def union_area(boxes):
+    """겹치는 부분을 한 번만 센 상자들의 합집합 면적"""
+    if not boxes:
+        return 0
+    xs = sorted({x for left, _top, right, _bottom in boxes for x in (left, right)})
+    ys = sorted({y for _left, top, _right, bottom in boxes for y in (top, bottom)})
+    covered = np.zeros((len(ys) - 1, len(xs) - 1), dtype=bool)
+    for left, top, right, bottom in boxes:
+        covered[ys.index(top):ys.index(bottom), xs.index(left):xs.index(right)] = True
+    cell_areas = np.outer(np.diff(ys), np.diff(xs))
+    return int(cell_areas[covered].sum())
+
+
+def crop_text_regions(image, boxes):
+    """
+    상자 리스트에 해당하는 영역을 잘라 이미지 리스트로 반환.
+    잘라낸 이미지는 원본 형식(JPEG 등) 정보가 없어 PNG로 저장되므로, PNG로 저장할 수 없는 모드(CMYK 등)는
+    RGB로 변환합니다 (투명 채널이 있으면 RGBA).
+    """
+    if image.mode not in ("1", "L", "RGB", "P", "LA", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    return [image.crop(box) for box in boxes]